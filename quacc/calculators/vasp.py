@@ -1,5 +1,4 @@
 import os
-from copy import deepcopy
 
 from ase.atoms import Atoms
 from ase.calculators.vasp import Vasp as Vasp_
@@ -16,7 +15,7 @@ from quacc.defaults.calcs import vasp as vasp_defaults
 from quacc.util.atoms import set_magmoms
 from quacc.util.yaml import load_yaml_calc
 
-DEFAULT_CALCS_DIR = os.path.dirname(vasp_defaults.__file__)
+DEFAULT_CALCS_DIR = os.path.dirname(os.path.realpath(vasp_defaults.__file__))
 
 
 def SmartVasp(
@@ -72,9 +71,6 @@ def SmartVasp(
         The ASE Atoms object with attached VASP calculator.
     """
 
-    # Copy the atoms to a new object so we don't modify the original
-    atoms = deepcopy(atoms)
-
     # Check constraints
     if (
         custodian
@@ -96,11 +92,8 @@ def SmartVasp(
         calc_preset = {}
 
     # Collect all the calculator parameters and prioritize the kwargs
-    # in the case of duplicates.
-    user_calc_params = {**calc_preset, **kwargs}
-    none_keys = [k for k, v in user_calc_params.items() if v is None]
-    for none_key in none_keys:
-        del user_calc_params[none_key]
+    # in the case of duplicates. Then remove any None or unused INCAR flags.
+    user_calc_params = remove_unused_flags({**calc_preset, **kwargs})
 
     # Allow the user to use setups='mysetups.yaml' to load in a custom setups
     # from a YAML file
@@ -118,22 +111,10 @@ def SmartVasp(
         del user_calc_params["auto_kpts"]
 
     # Handle special arguments in the user calc parameters that
-    # ASE does not natively support
-    if user_calc_params.get("elemental_magmoms") is not None:
-        elemental_mags_dict = user_calc_params["elemental_magmoms"]
-        del user_calc_params["elemental_magmoms"]
-    else:
-        elemental_mags_dict = None
-    if user_calc_params.get("auto_kpts") is not None:
-        auto_kpts = user_calc_params["auto_kpts"]
-        del user_calc_params["auto_kpts"]
-    else:
-        auto_kpts = None
-    if user_calc_params.get("auto_dipole") is not None:
-        auto_dipole = user_calc_params["auto_dipole"]
-        del user_calc_params["auto_dipole"]
-    else:
-        auto_dipole = None
+    # ASE does not natively support. None values were already removed above.
+    elemental_mags_dict = user_calc_params.pop("elemental_magmoms", None)
+    auto_kpts = user_calc_params.pop("auto_kpts", None)
+    auto_dipole = user_calc_params.pop("auto_dipole", None)
 
     # Make automatic k-point mesh
     if auto_kpts:
@@ -154,7 +135,8 @@ def SmartVasp(
         if "ldipol" not in user_calc_params:
             user_calc_params["ldipol"] = True
 
-    # Set magnetic moments
+    # Set magnetic moments. Note: set_magmoms returns a copy of the Atoms object,
+    # so the original is not modified
     atoms = set_magmoms(
         atoms,
         elemental_mags_dict=elemental_mags_dict,
@@ -163,16 +145,15 @@ def SmartVasp(
         mag_cutoff=mag_cutoff,
     )
 
-    # Remove unused INCAR flags
-    user_calc_params = remove_unused_flags(user_calc_params)
+    # Handle INCAR swaps as needed
+    if incar_copilot:
+        user_calc_params = calc_swaps(
+            atoms, user_calc_params, auto_kpts=auto_kpts, verbose=verbose
+        )
 
     # Instantiate the calculator!
     calc = Vasp_(command=command, **user_calc_params)
 
-    # Handle INCAR swaps as needed
-    if incar_copilot:
-        calc = calc_swaps(atoms, calc, auto_kpts=auto_kpts, verbose=verbose)
-
     # This is important! We want to make sure that setting
     # a new VASP parameter throws away the prior calculator results
     # otherwise we can't do things like run a new calculation
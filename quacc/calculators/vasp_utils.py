@@ -1,11 +1,13 @@
 import inspect
 import os
 import warnings
-from typing import Any, Dict, List, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
 
 import numpy as np
 from ase.atoms import Atoms
 from ase.calculators.vasp import Vasp
+from pymatgen.core import Structure
 from pymatgen.io.ase import AseAtomsAdaptor
 from pymatgen.io.vasp.inputs import Kpoints
 from pymatgen.symmetry.bandstructure import HighSymmKpath
@@ -98,64 +100,318 @@ def convert_auto_kpts(
     Optional[bool]
         The reciprocal command for use with the ASE Vasp calculator
     """
-    struct = AseAtomsAdaptor.get_structure(atoms)
+    scheme = next((k for k in _KPT_SCHEMES if auto_kpts.get(k, None)), None)
+    if scheme is None:
+        raise ValueError(f"Unsupported k-point generation scheme: {auto_kpts}.")
+
+    return _KPT_SCHEMES[scheme](_get_struct_key(atoms), auto_kpts[scheme], force_gamma)
+
+
+def _line_density_kpts(
+    struct_key: Tuple, line_density: float, force_gamma: bool
+) -> Tuple[np.ndarray, None, bool]:
+    """
+    K-points along a high-symmetry path.
+
+    Parameters
+    ----------
+    struct_key
+        Hashable structure key from _get_struct_key()
+    line_density
+        Number of k-points per reciprocal length along the path
+    force_gamma
+        Not used
+
+    Returns
+    -------
+    np.ndarray
+        Cartesian k-points for use with the ASE Vasp calculator
+    None
+        The gamma command for use with the ASE Vasp calculator
+    bool
+        The reciprocal command for use with the ASE Vasp calculator
+    """
+    # TODO: Support methods other than latimer-munro
+    kpts = np.array(_get_line_kpts(struct_key, line_density))
+    return kpts, None, True
 
-    if auto_kpts.get("line_density", None):
-        # TODO: Support methods other than latimer-munro
-        kpath = HighSymmKpath(struct, path_type="latimer_munro")
-        kpts, _ = kpath.get_kpoints(
-            line_density=auto_kpts["line_density"], coords_are_cartesian=True
-        )
-        kpts = np.stack(kpts)
-        reciprocal = True
-        gamma = None
 
+def _max_mixed_density_kpts(
+    struct_key: Tuple, max_mixed_density: List[float], force_gamma: bool
+) -> Tuple[List[int], bool, None]:
+    """
+    The denser of the reciprocal_density and grid_density k-point meshes.
+
+    Parameters
+    ----------
+    struct_key
+        Hashable structure key from _get_struct_key()
+    max_mixed_density
+        The reciprocal_density and grid_density values
+    force_gamma
+        Whether a gamma-centered mesh should be returned
+
+    Returns
+    -------
+    List[int, int, int]
+        List of k-points for use with the ASE Vasp calculator
+    bool
+        The gamma command for use with the ASE Vasp calculator
+    None
+        The reciprocal command for use with the ASE Vasp calculator
+    """
+    if len(max_mixed_density) != 2:
+        raise ValueError("Must specify two values for max_mixed_density.")
+
+    if max_mixed_density[0] > max_mixed_density[1]:
+        warnings.warn(
+            "Warning: It is not usual that kppvol > kppa. Please make sure you have chosen the right k-point densities.",
+        )
+    pmg_kpts1 = _get_automatic_kpts(
+        struct_key, "automatic_density_by_vol", max_mixed_density[0], force_gamma
+    )
+    pmg_kpts2 = _get_automatic_kpts(
+        struct_key, "automatic_density", max_mixed_density[1], force_gamma
+    )
+    if np.prod(pmg_kpts1[0]) >= np.prod(pmg_kpts2[0]):
+        pmg_kpts = pmg_kpts1
     else:
-        reciprocal = None
-        if auto_kpts.get("max_mixed_density", None):
-            if len(auto_kpts["max_mixed_density"]) != 2:
-                raise ValueError("Must specify two values for max_mixed_density.")
-
-            if auto_kpts["max_mixed_density"][0] > auto_kpts["max_mixed_density"][1]:
-                warnings.warn(
-                    "Warning: It is not usual that kppvol > kppa. Please make sure you have chosen the right k-point densities.",
-                )
-            pmg_kpts1 = Kpoints.automatic_density_by_vol(
-                struct, auto_kpts["max_mixed_density"][0], force_gamma=force_gamma
-            )
-            pmg_kpts2 = Kpoints.automatic_density(
-                struct, auto_kpts["max_mixed_density"][1], force_gamma=force_gamma
-            )
-            if np.product(pmg_kpts1.kpts[0]) >= np.product(pmg_kpts2.kpts[0]):
-                pmg_kpts = pmg_kpts1
-            else:
-                pmg_kpts = pmg_kpts2
-        elif auto_kpts.get("reciprocal_density", None):
-            pmg_kpts = Kpoints.automatic_density_by_vol(
-                struct, auto_kpts["reciprocal_density"], force_gamma=force_gamma
-            )
-        elif auto_kpts.get("grid_density", None):
-            pmg_kpts = Kpoints.automatic_density(
-                struct, auto_kpts["grid_density"], force_gamma=force_gamma
-            )
-        elif auto_kpts.get("length_density", None):
-            if len(auto_kpts["length_density"]) != 3:
-                raise ValueError("Must specify three values for length_density.")
-            pmg_kpts = Kpoints.automatic_density_by_lengths(
-                struct, auto_kpts["length_density"], force_gamma=force_gamma
-            )
-        else:
-            raise ValueError(f"Unsupported k-point generation scheme: {auto_kpts}.")
+        pmg_kpts = pmg_kpts2
+
+    return list(pmg_kpts[0]), pmg_kpts[1] == "gamma", None
+
+
+def _reciprocal_density_kpts(
+    struct_key: Tuple, reciprocal_density: float, force_gamma: bool
+) -> Tuple[List[int], bool, None]:
+    """
+    K-point mesh by number of k-points per reciprocal volume.
+
+    Parameters
+    ----------
+    struct_key
+        Hashable structure key from _get_struct_key()
+    reciprocal_density
+        Number of k-points per reciprocal atom volume
+    force_gamma
+        Whether a gamma-centered mesh should be returned
+
+    Returns
+    -------
+    List[int, int, int]
+        List of k-points for use with the ASE Vasp calculator
+    bool
+        The gamma command for use with the ASE Vasp calculator
+    None
+        The reciprocal command for use with the ASE Vasp calculator
+    """
+    pmg_kpts = _get_automatic_kpts(
+        struct_key, "automatic_density_by_vol", reciprocal_density, force_gamma
+    )
+    return list(pmg_kpts[0]), pmg_kpts[1] == "gamma", None
+
+
+def _grid_density_kpts(
+    struct_key: Tuple, grid_density: float, force_gamma: bool
+) -> Tuple[List[int], bool, None]:
+    """
+    K-point mesh by number of k-points per atom.
+
+    Parameters
+    ----------
+    struct_key
+        Hashable structure key from _get_struct_key()
+    grid_density
+        Number of k-points per reciprocal atom
+    force_gamma
+        Whether a gamma-centered mesh should be returned
+
+    Returns
+    -------
+    List[int, int, int]
+        List of k-points for use with the ASE Vasp calculator
+    bool
+        The gamma command for use with the ASE Vasp calculator
+    None
+        The reciprocal command for use with the ASE Vasp calculator
+    """
+    pmg_kpts = _get_automatic_kpts(
+        struct_key, "automatic_density", grid_density, force_gamma
+    )
+    return list(pmg_kpts[0]), pmg_kpts[1] == "gamma", None
+
+
+def _length_density_kpts(
+    struct_key: Tuple, length_density: List[float], force_gamma: bool
+) -> Tuple[List[int], bool, None]:
+    """
+    K-point mesh by number of k-points per reciprocal length along each axis.
+
+    Parameters
+    ----------
+    struct_key
+        Hashable structure key from _get_struct_key()
+    length_density
+        Number of k-points per reciprocal length along each lattice vector
+    force_gamma
+        Whether a gamma-centered mesh should be returned
+
+    Returns
+    -------
+    List[int, int, int]
+        List of k-points for use with the ASE Vasp calculator
+    bool
+        The gamma command for use with the ASE Vasp calculator
+    None
+        The reciprocal command for use with the ASE Vasp calculator
+    """
+    if len(length_density) != 3:
+        raise ValueError("Must specify three values for length_density.")
+    pmg_kpts = _get_automatic_kpts(
+        struct_key,
+        "automatic_density_by_lengths",
+        tuple(length_density),
+        force_gamma,
+    )
+    return list(pmg_kpts[0]), pmg_kpts[1] == "gamma", None
+
+
+# Supported auto_kpts schemes, in order of priority if several are given
+_KPT_SCHEMES = {
+    "line_density": _line_density_kpts,
+    "max_mixed_density": _max_mixed_density_kpts,
+    "reciprocal_density": _reciprocal_density_kpts,
+    "grid_density": _grid_density_kpts,
+    "length_density": _length_density_kpts,
+}
+
+
+def _get_struct_key(atoms: Atoms) -> Tuple:
+    """
+    Get a hashable representation of an Atoms object that contains
+    everything that goes into the Pymatgen Structure used for k-point
+    generation (i.e. the cell, species, positions, magnetic moments,
+    and oxidation states). This avoids building a Structure unless the
+    k-points actually need to be generated.
+
+    Parameters
+    ----------
+    .Atoms
+        ASE Atoms object
+
+    Returns
+    -------
+    Tuple
+        Hashable key that can be converted back via _struct_from_key()
+    """
+    arrays = {}
+    for prop in ("initial_magmoms", "oxi_states"):
+        if atoms.has(prop):
+            array = np.asarray(atoms.arrays[prop], dtype=float).round(8)
+            arrays[prop] = (array.shape, tuple(array.flatten()))
+
+    return (
+        tuple(atoms.cell.array.round(8).flatten()),
+        tuple(atoms.numbers.tolist()),
+        tuple(atoms.positions.round(8).flatten()),
+        tuple(sorted(arrays.items())),
+    )
+
+
+@lru_cache(maxsize=16)
+def _struct_from_key(struct_key: Tuple) -> Structure:
+    """
+    Build a Pymatgen Structure from the output of _get_struct_key().
+    This is memoized so that several k-point schemes (e.g. both meshes
+    of max_mixed_density) share a single Structure. The returned Structure
+    is shared between callers and must not be modified in-place.
+
+    Parameters
+    ----------
+    struct_key
+        Hashable structure key
 
-        kpts = pmg_kpts.kpts[0]
-        gamma = pmg_kpts.style.name.lower() == "gamma"
+    Returns
+    -------
+    Structure
+        Pymatgen Structure
+    """
+    cell, numbers, positions, arrays = struct_key
+    atoms = Atoms(
+        numbers=numbers,
+        positions=np.reshape(positions, (-1, 3)),
+        cell=np.reshape(cell, (3, 3)),
+        pbc=True,
+    )
+    for prop, (shape, values) in arrays:
+        atoms.set_array(prop, np.reshape(values, shape))
 
-    return kpts, gamma, reciprocal
+    return AseAtomsAdaptor.get_structure(atoms)
+
+
+@lru_cache(maxsize=256)
+def _get_line_kpts(
+    struct_key: Tuple, line_density: float
+) -> Tuple[Tuple[float, float, float], ...]:
+    """
+    Memoized k-point path generation with HighSymmKpath.
+
+    Parameters
+    ----------
+    struct_key
+        Hashable structure key from _get_struct_key()
+    line_density
+        Number of k-points per reciprocal length along the path
+
+    Returns
+    -------
+    Tuple[Tuple[float, float, float], ...]
+        Cartesian k-points along the high-symmetry path
+    """
+    kpath = HighSymmKpath(_struct_from_key(struct_key), path_type="latimer_munro")
+    kpts, _ = kpath.get_kpoints(line_density=line_density, coords_are_cartesian=True)
+    return tuple(tuple(kpt) for kpt in np.stack(kpts).tolist())
+
+
+@lru_cache(maxsize=256)
+def _get_automatic_kpts(
+    struct_key: Tuple,
+    method: str,
+    density: float | Tuple[float, float, float],
+    force_gamma: bool,
+) -> Tuple[Tuple[int, int, int], str]:
+    """
+    Memoized k-point mesh generation with one of the Kpoints.automatic_density*
+    methods.
+
+    Parameters
+    ----------
+    struct_key
+        Hashable structure key from _get_struct_key()
+    method
+        Name of the Kpoints method to call, e.g. "automatic_density"
+    density
+        The density argument to pass to the Kpoints method
+    force_gamma
+        Whether a gamma-centered mesh should be returned
+
+    Returns
+    -------
+    Tuple[int, int, int]
+        The k-point mesh
+    str
+        The lowercase name of the k-point style (e.g. "gamma")
+    """
+    pmg_kpts = getattr(Kpoints, method)(
+        _struct_from_key(struct_key), density, force_gamma=force_gamma
+    )
+    return tuple(pmg_kpts.kpts[0]), pmg_kpts.style.name.lower()
 
 
 def remove_unused_flags(user_calc_params: Dict[str, Any]) -> Dict[str, Any]:
     """
     Removes unused flags in the INCAR, like EDIFFG if you are doing NSW = 0.
+    Any flags set to None are removed as well.
 
     Parameters
     ----------
@@ -168,49 +424,318 @@ def remove_unused_flags(user_calc_params: Dict[str, Any]) -> Dict[str, Any]:
         Adjusted user-specified calculation parameters
     """
 
+    excluded_flags = set()
+
     # Turn off opt flags if NSW = 0
-    opt_flags = ("ediffg", "ibrion", "isif", "potim", "iopt")
-    if user_calc_params.get("nsw", 0) == 0:
-        for opt_flag in opt_flags:
-            user_calc_params.pop(opt_flag, None)
+    if not user_calc_params.get("nsw", 0):
+        excluded_flags.update(("ediffg", "ibrion", "isif", "potim", "iopt"))
 
     # Turn off +U flags if +U is not even used
-    ldau_flags = (
-        "ldau",
-        "ldauu",
-        "ldauj",
-        "ldaul",
-        "ldautype",
-        "ldauprint",
-        "ldau_luj",
-    )
     if not user_calc_params.get("ldau", False) and not user_calc_params.get(
         "ldau_luj", None
     ):
-        for ldau_flag in ldau_flags:
-            user_calc_params.pop(ldau_flag, None)
+        excluded_flags.update(
+            (
+                "ldau",
+                "ldauu",
+                "ldauj",
+                "ldaul",
+                "ldautype",
+                "ldauprint",
+                "ldau_luj",
+            )
+        )
+
+    return {
+        k: v
+        for k, v in user_calc_params.items()
+        if v is not None and k not in excluded_flags
+    }
+
+
+def _ncore_swaps(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Swaps to set NCORE = 1, also unsetting NPAR if it was set.
+
+    Parameters
+    ----------
+    params
+        Current calculation parameters
+
+    Returns
+    -------
+    Dict
+        Parameters to swap in
+    """
+    return (
+        {"ncore": 1, "npar": None} if params.get("npar") is not None else {"ncore": 1}
+    )
 
-    return user_calc_params
+
+# ALGO values that are suitable for hybrid calculations
+_HYBRID_ALGOS = frozenset({"all", "damped"})
+
+# IBRION values for finite difference and DFPT calculations, which do not
+# support NCORE/NPAR
+_FINITE_DIFF_IBRIONS = frozenset({5, 6, 7, 8})
+
+# The INCAR copilot rules, applied in order by calc_swaps(). Each rule is a
+# (keys, condition, action) tuple. The rule can only apply if at least one of
+# the parameters in keys is set (an empty tuple means the rule always needs to
+# be checked), which lets calc_swaps() skip most rules without evaluating them.
+# The condition takes the current parameters (p) and information about the
+# structure (s) and returns True if the rule applies. The action returns the
+# parameters to swap in and a message explaining why. Note that later rules
+# see the swaps made by earlier ones.
+_SWAP_RULES: List[
+    Tuple[
+        Tuple[str, ...],
+        Callable[[Dict[str, Any], Dict[str, Any]], bool],
+        Callable[[Dict[str, Any], Dict[str, Any]], Tuple[Dict[str, Any], str]],
+    ]
+] = [
+    (
+        (),
+        lambda p, s: (not p.get("lmaxmix") or p["lmaxmix"] < 6)
+        and s["max_block"] == "f",
+        lambda p, s: (
+            {"lmaxmix": 6},
+            "Copilot: Setting LMAXMIX = 6 because you have an f-element.",
+        ),
+    ),
+    (
+        (),
+        lambda p, s: (not p.get("lmaxmix") or p["lmaxmix"] < 4)
+        and s["max_block"] == "d",
+        lambda p, s: (
+            {"lmaxmix": 4},
+            "Copilot: Setting LMAXMIX = 4 because you have a d-element",
+        ),
+    ),
+    (
+        ("luse_vdw", "lhfcalc", "ldau", "ldau_luj", "metagga"),
+        lambda p, s: (
+            p.get("luse_vdw")
+            or p.get("lhfcalc")
+            or p.get("ldau")
+            or p.get("ldau_luj")
+            or p.get("metagga")
+        )
+        and not p.get("lasph"),
+        lambda p, s: (
+            {"lasph": True},
+            "Copilot: Setting LASPH = True because you have a +U, vdW, meta-GGA, or hybrid calculation.",
+        ),
+    ),
+    (
+        ("lasph",),
+        lambda p, s: p.get("lasph")
+        and (not p.get("lmaxtau") or p["lmaxtau"] < 8)
+        and s["max_block"] == "f",
+        lambda p, s: (
+            {"lmaxtau": 8},
+            "Copilot: Setting LMAXTAU = 8 because you have LASPH = True and an f-element.",
+        ),
+    ),
+    (
+        ("metagga",),
+        lambda p, s: p.get("metagga")
+        and (not p.get("algo") or p["algo"].lower() != "all"),
+        lambda p, s: (
+            {"algo": "all"},
+            "Copilot: Setting ALGO = All because you have a meta-GGA calculation.",
+        ),
+    ),
+    (
+        ("lhfcalc",),
+        lambda p, s: p.get("lhfcalc")
+        and (not p.get("algo") or p["algo"].lower() not in _HYBRID_ALGOS)
+        and s["is_metal"],
+        lambda p, s: (
+            {"algo": "damped", "time": 0.5},
+            "Copilot: Setting ALGO = Damped, TIME = 0.5 because you have a hybrid calculation with a metal.",
+        ),
+    ),
+    (
+        ("lhfcalc",),
+        lambda p, s: p.get("lhfcalc")
+        and (not p.get("algo") or p["algo"].lower() not in _HYBRID_ALGOS)
+        and not s["is_metal"],
+        lambda p, s: (
+            {"algo": "all"},
+            "Copilot: Setting ALGO = All because you have a hybrid calculation.",
+        ),
+    ),
+    (
+        ("ismear", "nsw"),
+        lambda p, s: s["is_metal"]
+        and (p.get("ismear") and p["ismear"] < 0)
+        and (p.get("nsw") and p["nsw"] > 0),
+        lambda p, s: (
+            {"ismear": 1, "sigma": 0.1},
+            "Copilot: You are relaxing a likely metal. Setting ISMEAR = 1 and SIGMA = 0.1.",
+        ),
+    ),
+    (
+        ("nedos",),
+        lambda p, s: p.get("nedos")
+        and p.get("ismear") != -5
+        and p.get("nsw") in {None, 0},
+        lambda p, s: (
+            {"ismear": -5, "sigma": 0.05},
+            "Copilot: Setting ISMEAR = -5 and SIGMA = 0.05 because you have a static DOS calculation.",
+        ),
+    ),
+    (
+        ("ismear",),
+        lambda p, s: p.get("ismear") == -5
+        and s["n_kpts"] < 4
+        and p.get("kspacing") is None,
+        lambda p, s: (
+            {"ismear": 0, "sigma": 0.05},
+            "Copilot: Setting ISMEAR = 0 and SIGMA = 0.05 because you don't have enough k-points for ISMEAR = -5.",
+        ),
+    ),
+    (
+        (),
+        lambda p, s: s["auto_kpts"]
+        and s["auto_kpts"].get("line_density", None)
+        and (p.get("ismear") != 0 or p.get("sigma") > 0.01),
+        lambda p, s: (
+            {"ismear": 0, "sigma": 0.01},
+            "Copilot: Setting ISMEAR = 0 and SIGMA = 0.01 because you are doing a line mode calculation.",
+        ),
+    ),
+    (
+        ("kspacing", "ismear"),
+        lambda p, s: p.get("kspacing")
+        and p["kspacing"] > 0.5
+        and p.get("ismear") == -5,
+        lambda p, s: (
+            {"ismear": 0, "sigma": 0.05},
+            "Copilot: KSPACING is likely too large for ISMEAR = -5. Setting ISMEAR = 0 and SIGMA = 0.05.",
+        ),
+    ),
+    (
+        ("nsw", "laechg"),
+        lambda p, s: p.get("nsw") and p["nsw"] > 0 and p.get("laechg"),
+        lambda p, s: (
+            {"laechg": None},
+            "Copilot: Setting LAECHG = False because you have NSW > 0. LAECHG is not compatible with NSW > 0.",
+        ),
+    ),
+    (
+        ("ldau", "ldau_luj"),
+        lambda p, s: p.get("ldauprint") in {None, 0}
+        and (p.get("ldau") or p.get("ldau_luj")),
+        lambda p, s: (
+            {"ldauprint": 1},
+            "Copilot: Setting LDAUPRINT = 1 because LDAU = True.",
+        ),
+    ),
+    (
+        ("lreal",),
+        lambda p, s: p.get("lreal") and p.get("nsw") in {None, 0, 1},
+        lambda p, s: (
+            {"lreal": False},
+            "Copilot: Setting LREAL = False because you are running a static calculation. LREAL != False can be bad for energies.",
+        ),
+    ),
+    (
+        (),
+        lambda p, s: not p.get("lorbit")
+        and (
+            p.get("ispin") == 2
+            or (
+                s["atoms"].has("initial_magmoms")
+                and np.any(s["atoms"].arrays["initial_magmoms"] != 0)
+            )
+        ),
+        lambda p, s: (
+            {"lorbit": 11},
+            "Copilot: Setting LORBIT = 11 because you have a spin-polarized calculation.",
+        ),
+    ),
+    (
+        ("ncore", "npar"),
+        lambda p, s: (
+            (p.get("ncore") and p["ncore"] > 1) or (p.get("npar") and p["npar"] > 1)
+        )
+        and (
+            p.get("lhfcalc") is True
+            or p.get("lrpa") is True
+            or p.get("lepsilon") is True
+            or p.get("ibrion") in _FINITE_DIFF_IBRIONS
+        ),
+        lambda p, s: (
+            _ncore_swaps(p),
+            "Copilot: Setting NCORE = 1 because NCORE/NPAR is not compatible with this job type.",
+        ),
+    ),
+    (
+        ("ncore", "npar"),
+        lambda p, s: (
+            (p.get("ncore") and p["ncore"] > 1) or (p.get("npar") and p["npar"] > 1)
+        )
+        and s["n_atoms"] <= 4,
+        lambda p, s: (
+            _ncore_swaps(p),
+            "Copilot: Setting NCORE = 1 because you have a very small structure.",
+        ),
+    ),
+    (
+        ("kpar",),
+        lambda p, s: p.get("kpar")
+        and p["kpar"] > s["n_kpts"]
+        and p.get("kspacing") is None,
+        lambda p, s: (
+            {"kpar": 1},
+            "Copilot: Setting KPAR = 1 because you have too few k-points to parallelize.",
+        ),
+    ),
+    (
+        ("nsw", "isym"),
+        lambda p, s: p.get("nsw") and p["nsw"] > 0 and p.get("isym") and p["isym"] > 0,
+        lambda p, s: (
+            {"isym": 0},
+            "Copilot: Setting ISYM = 0 because you are running a relaxation.",
+        ),
+    ),
+    (
+        ("lhfcalc",),
+        lambda p, s: p.get("lhfcalc") is True and p.get("isym") in {1, 2},
+        lambda p, s: (
+            {"isym": 3},
+            "Copilot: Setting ISYM = 3 because you are running a hybrid calculation.",
+        ),
+    ),
+]
+
+
+# All parameters that any of the copilot rules depend on
+_SWAP_RULE_KEYS = frozenset(key for keys, _, _ in _SWAP_RULES for key in keys)
 
 
 def calc_swaps(
     atoms: Atoms,
-    calc: Vasp,
+    user_calc_params: Dict[str, Any],
     auto_kpts: None
     | Dict[str, float]
     | Dict[str, List[Tuple[float, float]]]
     | Dict[str, List[Tuple[float, float, float]]],
     verbose: bool = True,
-) -> Vasp:
+) -> Dict[str, Any]:
     """
-    Swaps out bad INCAR flags.
+    Swaps out bad INCAR flags. This operates on the calculator parameters
+    before the calculator is instantiated so that all of the swaps can be
+    applied at once. The individual swaps are defined in _SWAP_RULES.
 
     Parameters
     ----------
     .Atoms
         Atoms object
-    .Vasp
-        ASE VASP calculator
+    user_calc_params
+        User-specified calculation parameters
     auto_kpts
         The automatic k-point scheme dictionary
     verbose
@@ -218,225 +743,39 @@ def calc_swaps(
 
     Returns
     -------
-    .Vasp
-        ASE VASP calculator with modified arguments.
+    Dict
+        Adjusted user-specified calculation parameters
     """
-    is_metal = check_is_metal(atoms)
-    max_block = get_highest_block(atoms)
-
-    if (
-        not calc.int_params["lmaxmix"] or calc.int_params["lmaxmix"] < 6
-    ) and max_block == "f":
-        if verbose:
-            warnings.warn("Copilot: Setting LMAXMIX = 6 because you have an f-element.")
-        calc.set(lmaxmix=6)
-    elif (
-        not calc.int_params["lmaxmix"] or calc.int_params["lmaxmix"] < 4
-    ) and max_block == "d":
-        if verbose:
-            warnings.warn("Copilot: Setting LMAXMIX = 4 because you have a d-element")
-        calc.set(lmaxmix=4)
-
-    if (
-        calc.bool_params["luse_vdw"]
-        or calc.bool_params["lhfcalc"]
-        or calc.bool_params["ldau"]
-        or calc.dict_params["ldau_luj"]
-        or calc.string_params["metagga"]
-    ) and not calc.bool_params["lasph"]:
-        if verbose:
-            warnings.warn(
-                "Copilot: Setting LASPH = True because you have a +U, vdW, meta-GGA, or hybrid calculation."
-            )
-        calc.set(lasph=True)
-
-    if (
-        calc.bool_params["lasph"]
-        and (not calc.int_params["lmaxtau"] or calc.int_params["lmaxtau"] < 8)
-        and max_block == "f"
-    ):
-        if verbose:
-            warnings.warn(
-                "Copilot: Setting LMAXTAU = 8 because you have LASPH = True and an f-element."
-            )
-        calc.set(lmaxtau=8)
-
-    if calc.string_params["metagga"] and (
-        not calc.string_params["algo"] or calc.string_params["algo"].lower() != "all"
-    ):
-        if verbose:
-            warnings.warn(
-                "Copilot: Setting ALGO = All because you have a meta-GGA calculation."
-            )
-        calc.set(algo="all")
-
-    if calc.bool_params["lhfcalc"] and (
-        not calc.string_params["algo"]
-        or calc.string_params["algo"].lower() not in ["all", "damped"]
-    ):
-        if is_metal:
-            calc.set(algo="damped", time=0.5)
+    struct_info = {
+        "atoms": atoms,
+        "auto_kpts": auto_kpts,
+        "is_metal": check_is_metal(atoms),
+        "max_block": get_highest_block(atoms),
+        "n_atoms": len(atoms),
+        "n_kpts": np.prod(user_calc_params.get("kpts", (1, 1, 1))),
+    }
+
+    # The Vasp calculator applies the defaults for a given xc before
+    # any user-specified parameters, so we do the same here.
+    xc = user_calc_params.get("xc", None)
+    xc_defaults = Vasp.xc_defaults.get(xc.lower(), {}) if xc else {}
+    params = {**xc_defaults, **user_calc_params}
+    swaps = {}
+
+    # Only rules that depend on a parameter that is set need to be checked
+    set_keys = {k for k in _SWAP_RULE_KEYS if params.get(k)}
+    for keys, condition, action in _SWAP_RULES:
+        if keys and set_keys.isdisjoint(keys):
+            continue
+        if condition(params, struct_info):
+            new_params, msg = action(params, struct_info)
             if verbose:
-                warnings.warn(
-                    "Copilot: Setting ALGO = Damped, TIME = 0.5 because you have a hybrid calculation with a metal."
-                )
-        else:
-            calc.set(algo="all")
-            if verbose:
-                warnings.warn(
-                    "Copilot: Setting ALGO = All because you have a hybrid calculation."
-                )
-
-    if (
-        is_metal
-        and (calc.int_params["ismear"] and calc.int_params["ismear"] < 0)
-        and (calc.int_params["nsw"] and calc.int_params["nsw"] > 0)
-    ):
-        if verbose:
-            warnings.warn(
-                "Copilot: You are relaxing a likely metal. Setting ISMEAR = 1 and SIGMA = 0.1."
-            )
-        calc.set(ismear=1, sigma=0.1)
-
-    if (
-        calc.int_params["nedos"]
-        and calc.int_params["ismear"] != -5
-        and calc.int_params["nsw"] in (None, 0)
-    ):
-        if verbose:
-            warnings.warn(
-                "Copilot: Setting ISMEAR = -5 and SIGMA = 0.05 because you have a static DOS calculation."
-            )
-        calc.set(ismear=-5, sigma=0.05)
-
-    if (
-        calc.int_params["ismear"] == -5
-        and np.product(calc.kpts) < 4
-        and calc.float_params["kspacing"] is None
-    ):
-        if verbose:
-            warnings.warn(
-                "Copilot: Setting ISMEAR = 0 and SIGMA = 0.05 because you don't have enough k-points for ISMEAR = -5."
-            )
-        calc.set(ismear=0, sigma=0.05)
-
-    if (
-        auto_kpts
-        and auto_kpts.get("line_density", None)
-        and (calc.int_params["ismear"] != 0 or calc.float_params["sigma"] > 0.01)
-    ):
-        if verbose:
-            warnings.warn(
-                "Copilot: Setting ISMEAR = 0 and SIGMA = 0.01 because you are doing a line mode calculation."
-            )
-        calc.set(ismear=0, sigma=0.01)
-
-    if (
-        calc.float_params["kspacing"]
-        and (calc.float_params["kspacing"] and calc.float_params["kspacing"] > 0.5)
-        and calc.int_params["ismear"] == -5
-    ):
-        if verbose:
-            warnings.warn(
-                "Copilot: KSPACING is likely too large for ISMEAR = -5. Setting ISMEAR = 0 and SIGMA = 0.05."
-            )
-        calc.set(ismear=0, sigma=0.05)
-
-    if (
-        calc.int_params["nsw"]
-        and calc.int_params["nsw"] > 0
-        and calc.bool_params["laechg"]
-    ):
-        if verbose:
-            warnings.warn(
-                "Copilot: Setting LAECHG = False because you have NSW > 0. LAECHG is not compatible with NSW > 0."
-            )
-        calc.set(laechg=None)
-
-    if calc.int_params["ldauprint"] in (None, 0) and (
-        calc.bool_params["ldau"] or calc.dict_params["ldau_luj"]
-    ):
-        if verbose:
-            warnings.warn("Copilot: Setting LDAUPRINT = 1 because LDAU = True.")
-        calc.set(ldauprint=1)
-
-    if calc.special_params["lreal"] and calc.int_params["nsw"] in (None, 0, 1):
-        if verbose:
-            warnings.warn(
-                "Copilot: Setting LREAL = False because you are running a static calculation. LREAL != False can be bad for energies."
-            )
-        calc.set(lreal=False)
-
-    if not calc.int_params["lorbit"] and (
-        calc.int_params["ispin"] == 2
-        or np.any(atoms.get_initial_magnetic_moments() != 0)
-    ):
-        if verbose:
-            warnings.warn(
-                "Copilot: Setting LORBIT = 11 because you have a spin-polarized calculation."
-            )
-        calc.set(lorbit=11)
-
-    if (
-        (calc.int_params["ncore"] and calc.int_params["ncore"] > 1)
-        or (calc.int_params["npar"] and calc.int_params["npar"] > 1)
-    ) and (
-        calc.bool_params["lhfcalc"] is True
-        or calc.bool_params["lrpa"] is True
-        or calc.bool_params["lepsilon"] is True
-        or calc.int_params["ibrion"] in [5, 6, 7, 8]
-    ):
-        if verbose:
-            warnings.warn(
-                "Copilot: Setting NCORE = 1 because NCORE/NPAR is not compatible with this job type."
-            )
-        calc.set(ncore=1)
-        if calc.int_params.get("npar", None) is not None:
-            calc.int_params["npar"] = None
-
-    if (
-        (calc.int_params["ncore"] and calc.int_params["ncore"] > 1)
-        or (calc.int_params["npar"] and calc.int_params["npar"] > 1)
-    ) and len(atoms) <= 4:
-        if verbose:
-            warnings.warn(
-                "Copilot: Setting NCORE = 1 because you have a very small structure."
-            )
-        calc.set(ncore=1)
-        if calc.int_params.get("npar", None) is not None:
-            calc.int_params["npar"] = None
-
-    if (
-        calc.int_params["kpar"]
-        and calc.int_params["kpar"] > np.prod(calc.kpts)
-        and calc.float_params["kspacing"] is None
-    ):
-        if verbose:
-            warnings.warn(
-                "Copilot: Setting KPAR = 1 because you have too few k-points to parallelize."
-            )
-        calc.set(kpar=1)
-
-    if (
-        calc.int_params["nsw"]
-        and calc.int_params["nsw"] > 0
-        and calc.int_params["isym"]
-        and calc.int_params["isym"] > 0
-    ):
-        if verbose:
-            warnings.warn(
-                "Copilot: Setting ISYM = 0 because you are running a relaxation."
-            )
-        calc.set(isym=0)
-
-    if calc.bool_params["lhfcalc"] is True and calc.int_params["isym"] in (1, 2):
-        if verbose:
-            warnings.warn(
-                "Copilot: Setting ISYM = 3 because you are running a hybrid calculation."
-            )
-        calc.set(isym=3)
+                warnings.warn(msg)
+            params.update(new_params)
+            swaps.update(new_params)
+            set_keys.update(k for k, v in new_params.items() if v)
 
-    if calc.bool_params["luse_vdw"] and "ASE_VASP_VDW" not in os.environ:
+    if params.get("luse_vdw") and "ASE_VASP_VDW" not in os.environ:
         warnings.warn("ASE_VASP_VDW was not set, yet you requested a vdW functional.")
 
-    return calc
+    return {**user_calc_params, **swaps}
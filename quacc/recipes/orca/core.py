@@ -90,8 +90,10 @@ class StaticMaker(Maker):
         atoms.calc = ORCA(
             orcasimpleinput=orcasimpleinput,
             orcablocks=orcablocks,
-            charge=charge if charge else round(sum(atoms.get_initial_charges())),
-            mult=mult if mult else round(1 + sum(atoms.get_initial_magnetic_moments())),
+            charge=charge if charge else round(atoms.get_initial_charges().sum()),
+            mult=mult
+            if mult
+            else round(1 + atoms.get_initial_magnetic_moments().sum()),
         )
         atoms = run_calc(atoms)
         summary = summarize_run(
@@ -184,8 +186,10 @@ class RelaxMaker(Maker):
         atoms.calc = ORCA(
             orcasimpleinput=orcasimpleinput,
             orcablocks=orcablocks,
-            charge=charge if charge else round(sum(atoms.get_initial_charges())),
-            mult=mult if mult else round(1 + sum(atoms.get_initial_magnetic_moments())),
+            charge=charge if charge else round(atoms.get_initial_charges().sum()),
+            mult=mult
+            if mult
+            else round(1 + atoms.get_initial_magnetic_moments().sum()),
         )
         atoms = run_calc(atoms)
         summary = summarize_run(
@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Any, Dict
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Tuple
 
 from ase.atoms import Atoms
 from jobflow import Flow, Maker, Response, job
@@ -148,8 +148,8 @@ class BulkToSlabMaker(Maker):
 
     name: str = "VASP-BulkToSlab"
     preset: None | str = None
-    slab_relax_maker: Maker = SlabRelaxMaker()
-    slab_static_maker: Maker = SlabStaticMaker()
+    slab_relax_maker: Maker = field(default_factory=SlabRelaxMaker)
+    slab_static_maker: Maker = field(default_factory=SlabStaticMaker)
     swaps: Dict[str, Any] = None
 
     @job
@@ -174,24 +174,20 @@ class BulkToSlabMaker(Maker):
             A Flow of relaxation and static jobs for the generated slabs.
         """
         slabgen_kwargs = slabgen_kwargs or {}
-        self.slab_relax_maker.preset = self.slab_relax_maker.preset or self.preset
-        self.slab_static_maker.preset = self.slab_static_maker.preset or self.preset
-        self.slab_relax_maker.swaps = self.slab_relax_maker.swaps or self.swaps
-        self.slab_static_maker.swaps = self.slab_static_maker.swaps or self.swaps
+        relax_maker, static_maker = _prep_slab_makers(
+            self.slab_relax_maker, self.slab_static_maker, self.preset, self.swaps
+        )
 
         slabs = make_max_slabs_from_bulk(atoms, max_slabs=max_slabs, **slabgen_kwargs)
-        jobs = []
-        outputs = []
-        for slab in slabs:
-            relax_job = self.slab_relax_maker.make(slab)
-            jobs.append(relax_job)
-            outputs.append(relax_job.output)
+        # Each slab gets its own sub-flow so that the independent
+        # relax -> static chains are explicitly parallel to one another.
+        slab_flows = []
+        for i, slab in enumerate(slabs):
+            relax_job = relax_maker.make(slab)
+            static_job = static_maker.make(relax_job.output["atoms"])
+            slab_flows.append(Flow([relax_job, static_job], name=f"slab{i}"))
 
-            static_job = self.slab_static_maker.make(relax_job.output["atoms"])
-            jobs.append(static_job)
-            outputs.append(static_job.output)
-
-        return Response(replace=Flow(jobs))
+        return Response(replace=Flow(slab_flows, name=self.name))
 
 
 @dataclass
@@ -218,8 +214,8 @@ class SlabToAdsSlabMaker(Maker):
     name: str = "VASP-SlabToAdsSlab"
     preset: None | str = None
     swaps: Dict[str, Any] = None
-    slab_relax_maker: Maker = SlabRelaxMaker()
-    slab_static_maker: Maker = SlabStaticMaker()
+    slab_relax_maker: Maker = field(default_factory=SlabRelaxMaker)
+    slab_static_maker: Maker = field(default_factory=SlabStaticMaker)
 
     @job
     def make(
@@ -243,22 +239,53 @@ class SlabToAdsSlabMaker(Maker):
             A Flow of relaxation and static jobs for the generated slabs with adsorbates.
         """
         slabgen_ads_kwargs = slabgen_ads_kwargs or {}
-        self.slab_relax_maker.preset = self.slab_relax_maker.preset or self.preset
-        self.slab_static_maker.preset = self.slab_static_maker.preset or self.preset
-        self.slab_relax_maker.swaps = self.slab_relax_maker.swaps or self.swaps
-        self.slab_static_maker.swaps = self.slab_static_maker.swaps or self.swaps
+        relax_maker, static_maker = _prep_slab_makers(
+            self.slab_relax_maker, self.slab_static_maker, self.preset, self.swaps
+        )
 
         slabs = make_adsorbate_structures(atoms, adsorbate, **slabgen_ads_kwargs)
 
-        jobs = []
-        outputs = []
-        for slab in slabs:
-            relax_job = self.slab_relax_maker.make(slab)
-            jobs.append(relax_job)
-            outputs.append(relax_job.output)
+        # Each slab gets its own sub-flow so that the independent
+        # relax -> static chains are explicitly parallel to one another.
+        slab_flows = []
+        for i, slab in enumerate(slabs):
+            relax_job = relax_maker.make(slab)
+            static_job = static_maker.make(relax_job.output["atoms"])
+            slab_flows.append(Flow([relax_job, static_job], name=f"slab{i}"))
+
+        return Response(replace=Flow(slab_flows, name=self.name))
+
 
-            static_job = self.slab_static_maker.make(relax_job.output["atoms"])
-            jobs.append(static_job)
-            outputs.append(static_job.output)
+def _prep_slab_makers(
+    slab_relax_maker: Maker,
+    slab_static_maker: Maker,
+    preset: None | str = None,
+    swaps: Dict[str, Any] = None,
+) -> Tuple[Maker, Maker]:
+    """
+    Applies the flow-wide preset and swaps to the slab relaxation and static
+    makers. This is done once per flow, on copies of the makers, so the same
+    two makers can be used for every slab without modifying the originals.
 
-        return Response(replace=Flow(jobs))
+    Parameters
+    ----------
+    slab_relax_maker
+        Maker to use for the SlabRelax jobs.
+    slab_static_maker
+        Maker to use for the SlabStatic jobs.
+    preset
+        Flow-wide preset, used if the maker does not have its own.
+    swaps
+        Flow-wide swaps, used if the maker does not have its own.
+
+    Returns
+    -------
+    Maker
+        Maker to use for the SlabRelax jobs.
+    Maker
+        Maker to use for the SlabStatic jobs.
+    """
+    return tuple(
+        replace(maker, preset=maker.preset or preset, swaps=maker.swaps or swaps)
+        for maker in (slab_relax_maker, slab_static_maker)
+    )
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from copy import deepcopy
 from typing import Any, Dict
 
@@ -7,6 +8,14 @@ from atomate2.common.schemas.molecule import MoleculeMetadata
 from atomate2.common.schemas.structure import StructureMetadata
 from pymatgen.io.ase import AseAtomsAdaptor
 
+from quacc.util.atoms import get_atoms_id
+
+# Structure/molecule metadata, keyed by get_atoms_id(). The same structures
+# (e.g. the bulk that every slab in a flow was cut from) are often stored
+# many times over, and the symmetry analysis is not cheap.
+_METADATA_CACHE: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+_METADATA_CACHE_MAXSIZE = 100
+
 
 def atoms_to_metadata(
     atoms: Atoms, get_metadata: bool = True, strip_info: bool = False
@@ -37,12 +46,7 @@ def atoms_to_metadata(
     # Get Atoms metadata, if requested. Atomate2 already has built-in tools for
     # generating pymatgen Structure/Molecule metadata, so we'll just use that.
     if get_metadata:
-        if np.all(atoms.pbc == False):
-            mol = AseAtomsAdaptor().get_molecule(atoms)
-            metadata = MoleculeMetadata().from_molecule(mol).dict()
-        else:
-            struct = AseAtomsAdaptor().get_structure(atoms)
-            metadata = StructureMetadata().from_structure(struct).dict()
+        metadata = _get_metadata(atoms)
     else:
         metadata = {}
 
@@ -78,3 +82,36 @@ def atoms_to_metadata(
     atoms_doc = {**metadata, **results}
 
     return atoms_doc
+
+
+def _get_metadata(atoms: Atoms) -> Dict[str, Any]:
+    """
+    Get the Atomate2 structure or molecule metadata for an Atoms object,
+    re-using previously generated metadata for identical Atoms objects.
+
+    Parameters
+    ----------
+    atoms
+        ASE Atoms object
+
+    Returns
+    -------
+    Dict
+        A copy of the metadata that is safe to modify.
+    """
+    key = get_atoms_id(atoms)
+    metadata = _METADATA_CACHE.get(key)
+    if metadata is None:
+        if np.all(atoms.pbc == False):
+            mol = AseAtomsAdaptor().get_molecule(atoms)
+            metadata = MoleculeMetadata().from_molecule(mol).dict()
+        else:
+            struct = AseAtomsAdaptor().get_structure(atoms)
+            metadata = StructureMetadata().from_structure(struct).dict()
+        _METADATA_CACHE[key] = metadata
+        if len(_METADATA_CACHE) > _METADATA_CACHE_MAXSIZE:
+            _METADATA_CACHE.popitem(last=False)
+    else:
+        _METADATA_CACHE.move_to_end(key)
+
+    return deepcopy(metadata)
@@ -90,11 +90,11 @@ def summarize_run(
     if bader:
         try:
             bader_stats = run_bader(dir_path)
-        except:
+        except Exception:
             bader_stats = None
             warnings.warn("Bader analysis could not be performed.")
 
-        if bader_stats:
+        if bader_stats is not None:
             results["bader"] = bader_stats
 
             # Attach bader charges/spins to structure object
@@ -137,12 +137,15 @@ def _remove_empties(d: Dict[str, Any]) -> Dict[str, Any]:
         jsonify'd dictionary
     """
 
+    # Only recurse into containers. Large lists of numbers (e.g. DOS,
+    # eigenvalues, forces) are common here, and a function call per
+    # element dominates the runtime otherwise.
     if isinstance(d, dict):
         return {
-            k: _remove_empties(v)
+            k: _remove_empties(v) if isinstance(v, (dict, list)) else v
             for k, v in d.items()
             if v is not None and not (isinstance(v, (dict, list)) and len(v) == 0)
         }
     if isinstance(d, list):
-        return [_remove_empties(v) for v in d]
+        return [_remove_empties(v) if isinstance(v, (dict, list)) else v for v in d]
     return d
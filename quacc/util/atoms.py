@@ -1,12 +1,12 @@
 import hashlib
 import os
 from copy import deepcopy
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import numpy as np
 from ase.atoms import Atoms
 from ase.io.jsonio import encode
-from pymatgen.io.ase import AseAtomsAdaptor
+from pymatgen.core import Element
 
 # NOTES:
 # - Anytime an Atoms object is converted to a pmg structure, make sure
@@ -150,7 +150,7 @@ def set_magmoms(
     # Handle the magnetic moments
     # Check if a prior job was run and pull the prior magmoms
     if hasattr(atoms, "calc") and getattr(atoms.calc, "results", None) is not None:
-        mags = atoms.calc.results.get("magmoms", [0.0] * len(atoms))
+        mags = atoms.calc.results.get("magmoms", np.zeros(len(atoms)))
         # Note: It is important that we set mags to 0.0 here rather than None if the
         # calculator has no magmoms because: 1) ispin=1 might be set, and 2) we do
         # not want the preset magmoms to be used.
@@ -169,11 +169,12 @@ def set_magmoms(
             # those by element. If the element isn't in the magmoms dict
             # then set it to mag_default.
             if elemental_mags_dict:
-                initial_mags = np.array(
-                    [
-                        elemental_mags_dict.get(atom.symbol, mag_default)
-                        for atom in atoms
-                    ]
+                symbols = atoms.get_chemical_symbols()
+                get_mag = elemental_mags_dict.get
+                initial_mags = np.fromiter(
+                    (get_mag(symbol, mag_default) for symbol in symbols),
+                    dtype=np.float64,
+                    count=len(symbols),
                 )
                 atoms.set_initial_magnetic_moments(initial_mags)
     # Copy converged magmoms to input magmoms, if copy_magmoms is True
@@ -182,11 +183,12 @@ def set_magmoms(
             atoms.set_initial_magnetic_moments(mags)
 
     # If all the set mags are below mag_cutoff, set them to 0
-    if mag_cutoff:
-        has_new_initial_mags = atoms.has("initial_magmoms")
-        new_initial_mags = atoms.get_initial_magnetic_moments()
-        if has_new_initial_mags and np.all(np.abs(new_initial_mags) < mag_cutoff):
-            atoms.set_initial_magnetic_moments([0.0] * len(atoms))
+    if (
+        mag_cutoff
+        and atoms.has("initial_magmoms")
+        and np.all(np.abs(atoms.arrays["initial_magmoms"]) < mag_cutoff)
+    ):
+        atoms.set_initial_magnetic_moments(np.zeros(len(atoms)))
 
     return atoms
 
@@ -207,9 +209,10 @@ def get_atoms_id(atoms: Atoms) -> str:
         MD5 hash of the .Atoms object
     """
 
-    atoms = deepcopy(atoms)
+    # Atoms.copy() does not carry over the calculator, and the .info dict is
+    # thrown away anyway, so there is no need to deepcopy either of them
+    atoms = atoms.copy()
     atoms.info = {}
-    atoms.calc = None
     encoded_atoms = encode(atoms)
     # This is a hack to avoid int32/int64 and float32/float64 differences
     # between machines.
@@ -237,11 +240,7 @@ def check_is_metal(atoms: Atoms) -> bool:
     bool
         True if the structure is likely a metal; False otherwise
     """
-    if np.all(atoms.pbc) == False:
-        struct = AseAtomsAdaptor.get_molecule(atoms)
-    else:
-        struct = AseAtomsAdaptor.get_structure(atoms)
-    is_metal = all(k.is_metal for k in struct.composition.keys())
+    is_metal = all(element.is_metal for element in _get_unique_elements(atoms))
     return is_metal
 
 
@@ -259,11 +258,7 @@ def get_highest_block(atoms: Atoms) -> str:
     str
         highest block of the structure
     """
-    if np.all(atoms.pbc) == False:
-        struct = AseAtomsAdaptor.get_molecule(atoms)
-    else:
-        struct = AseAtomsAdaptor.get_structure(atoms)
-    blocks = [site.specie.block for site in struct]
+    blocks = {element.block for element in _get_unique_elements(atoms)}
     if "f" in blocks:
         max_block = "f"
     elif "d" in blocks:
@@ -274,3 +269,22 @@ def get_highest_block(atoms: Atoms) -> str:
         max_block = "s"
 
     return max_block
+
+
+def _get_unique_elements(atoms: Atoms) -> List[Element]:
+    """
+    Get the unique elements in an Atoms object. This is much cheaper than
+    building a full Pymatgen Structure/Molecule when only elemental
+    properties are needed.
+
+    Parameters
+    ----------
+    atoms
+        .Atoms object
+
+    Returns
+    -------
+    List[Element]
+        Unique Pymatgen Elements in the Atoms object
+    """
+    return [Element.from_Z(int(z)) for z in np.unique(atoms.numbers)]
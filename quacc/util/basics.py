@@ -25,11 +25,12 @@ def merge_dicts(
     remove_false
         If True, all keys with a value of False in the merged dictionary will be removed.
     """
-    d1_clean = {k.lower(): v for k, v in d1.items()}
-    d2_clean = {k.lower(): v for k, v in d2.items()}
-    d_merged = {**d1_clean, **d2_clean}
-    if remove_none:
-        d_merged = {k: v for k, v in d_merged.items() if v is not None}
-    if remove_false:
-        d_merged = {k: v for k, v in d_merged.items() if v is not False}
+    # Later entries take priority, so keys in d2 override those in d1
+    d_merged = {k.lower(): v for d in (d1, d2) for k, v in d.items()}
+    if remove_none or remove_false:
+        d_merged = {
+            k: v
+            for k, v in d_merged.items()
+            if not (remove_none and v is None) and not (remove_false and v is False)
+        }
     return d_merged
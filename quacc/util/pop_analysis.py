@@ -1,8 +1,11 @@
 import os
 from typing import Any, Dict
 
-from pymatgen.command_line.bader_caller import bader_analysis_from_path
-from pymatgen.command_line.chargemol_caller import ChargemolAnalysis
+import numpy as np
+
+# VASP output files needed for the population analyses. Each may be gzip'd.
+_REQUIRED_FILES = ("CHGCAR", "AECCAR0", "AECCAR2", "POTCAR")
+_REQUIRED_FILES_GZ = tuple(f"{f}.gz" for f in _REQUIRED_FILES)
 
 
 def run_bader(path: None | str = None) -> Dict[str, Any]:
@@ -41,20 +44,21 @@ def run_bader(path: None | str = None) -> Dict[str, Any]:
         path = os.getcwd()
 
     # Make sure files are present.
-    for f in ["CHGCAR", "AECCAR0", "AECCAR2", "POTCAR"]:
-        if not os.path.exists(os.path.join(path, f)) and not os.path.exists(
-            os.path.join(path, f"{f}.gz")
-        ):
-            raise FileNotFoundError(f"Could not find {f} in {path}.")
+    _check_required_files(path)
+
+    # Run Bader analysis. This is imported here because the Pymatgen
+    # command_line modules are slow to import and rarely needed.
+    from pymatgen.command_line.bader_caller import bader_analysis_from_path
 
-    # Run Bader analysis
     bader_stats = bader_analysis_from_path(path)
 
     # Store the partial charge, which is much more useful than the
     # raw charge and is more intuitive than the charge transferred.
     # An atom with a positive partial charge is cationic, whereas
     # an atom with a negative partial charge is anionic.
-    bader_stats["partial_charges"] = [-c for c in bader_stats["charge_transfer"]]
+    bader_stats["partial_charges"] = (
+        -np.asarray(bader_stats["charge_transfer"], dtype=np.float64)
+    ).tolist()
 
     # Some cleanup of the returned dictionary
     if "magmom" in bader_stats:
@@ -113,17 +117,16 @@ def run_chargemol(
         path = os.getcwd()
 
     # Make sure files are present.
-    for f in ["CHGCAR", "AECCAR0", "AECCAR2", "POTCAR"]:
-        if not os.path.exists(os.path.join(path, f)) and not os.path.exists(
-            os.path.join(path, f"{f}.gz")
-        ):
-            raise FileNotFoundError(f"Could not find {f} in {path}.")
+    _check_required_files(path)
 
     # Check environment variable
     if atomic_densities_path is None and "DDEC6_ATOMIC_DENSITIES_DIR" not in os.environ:
         raise OSError("DDEC6_ATOMIC_DENSITIES_DIR environment variable not defined.")
 
-    # Run Chargemol analysis
+    # Run Chargemol analysis. This is imported here because the Pymatgen
+    # command_line modules are slow to import and rarely needed.
+    from pymatgen.command_line.chargemol_caller import ChargemolAnalysis
+
     chargemol_stats = ChargemolAnalysis(
         path=path,
         atomic_densities_path=atomic_densities_path,
@@ -135,3 +138,26 @@ def run_chargemol(
     chargemol_stats.pop("rfourth_moments", None)
 
     return chargemol_stats
+
+
+def _check_required_files(path: str) -> None:
+    """
+    Checks that the VASP output files needed for the population analyses
+    (or their gzip'd versions) are present. A single directory listing is
+    used since it is much cheaper than stat-ing each file (and its .gz)
+    on networked filesystems.
+
+    Parameters
+    ----------
+    path
+        The path where the VASP output files are located.
+    """
+    with os.scandir(path) as it:
+        entries = {entry.name for entry in it}
+    missing = [
+        f
+        for f, f_gz in zip(_REQUIRED_FILES, _REQUIRED_FILES_GZ)
+        if f not in entries and f_gz not in entries
+    ]
+    if missing:
+        raise FileNotFoundError(f"Could not find {', '.join(missing)} in {path}.")
@@ -1,5 +1,5 @@
 import warnings
-from copy import deepcopy
+from math import ceil
 from typing import Any, Dict, List
 
 import numpy as np
@@ -41,17 +41,34 @@ def flip_atoms(
         Inverted slab
     """
 
+    if return_struct and not isinstance(atoms, Atoms):
+        # Skip the full AseAtomsAdaptor round-trip for Pymatgen objects. Only
+        # the positions and cell are needed for the flip, and the species and
+        # site properties can be carried over as-is.
+        new_atoms = Atoms(
+            positions=atoms.cart_coords, cell=atoms.lattice.matrix, pbc=True
+        )
+        new_atoms.rotate(180, "x")
+        new_atoms.wrap()
+
+        return Structure(
+            atoms.lattice,
+            atoms.species,
+            new_atoms.positions,
+            coords_are_cartesian=True,
+            site_properties=atoms.site_properties,
+        )
+
     if isinstance(atoms, Atoms):
-        new_atoms = deepcopy(atoms)
-        atoms_info = atoms.info.copy()
+        # Atoms.copy() already makes a (shallow) copy of the .info dict
+        new_atoms = atoms.copy()
     else:
         new_atoms = AseAtomsAdaptor.get_atoms(atoms)
-        atoms_info = {}
+        new_atoms.info = {}
 
     new_atoms.rotate(180, "x")
     new_atoms.wrap()
 
-    new_atoms.info = atoms_info
     if return_struct:
         new_atoms = AseAtomsAdaptor.get_structure(new_atoms)
 
@@ -103,107 +120,24 @@ def make_slabs_from_bulk(
 
     # Use pymatgen to generate slabs
     struct = AseAtomsAdaptor.get_structure(atoms)
-    atoms_info = atoms.info.copy()
 
     # Make all the slabs
-    slabs = generate_all_slabs(
+    slabs = _generate_raw_slabs(
         struct,
         max_index,
         min_slab_size,
         min_vacuum_size,
-        center_slab=True,
+        flip_asymmetric=flip_asymmetric,
         **slabgen_kwargs,
     )
 
-    # If the two terminations are not equivalent, make new slab
-    # by inverting the original slab and add it to the list
-    if flip_asymmetric:
-
-        new_slabs = []
-        for slab in slabs:
-            if not slab.is_symmetric():
-
-                # Flip the slab and its oriented unit cell
-                new_slab = flip_atoms(slab, return_struct=True)
-                new_oriented_unit_cell = flip_atoms(
-                    slab.oriented_unit_cell, return_struct=True
-                )
-
-                # Reconstruct the full slab object, noting the new
-                # shift and oriented unit cell
-                new_slab = Slab(
-                    new_slab.lattice,
-                    new_slab.species,
-                    coords=new_slab.frac_coords,
-                    miller_index=slab.miller_index,
-                    oriented_unit_cell=new_oriented_unit_cell,
-                    shift=-slab.shift,
-                    scale_factor=slab.scale_factor,
-                    site_properties=new_slab.site_properties,
-                )
-
-                # It looks better to center the inverted slab so we do
-                # that here.
-                new_slab = center_slab(new_slab)
-
-                # Add the new slab to the list
-                new_slabs.append(new_slab)
-
-        slabs.extend(new_slabs)
-
-    # For each slab, make sure the lengths and widths are large enough
-    # and fix atoms z_fix away from the top of the slab.
-    slabs_with_props = []
-    for slab in slabs:
-
-        # Supercell creation (if necessary)
-        a_factor = int(np.ceil(min_length_width / slab.lattice.abc[0]))
-        b_factor = int(np.ceil(min_length_width / slab.lattice.abc[1]))
-        slab_with_props = slab.copy()
-        slab_with_props.make_supercell([a_factor, b_factor, 1])
-
-        # Apply constraints by distance from top surface
-        # This does not actually create an adsorbate. It is just a
-        # useful function for finding surface vs. subsurface sites
-        if z_fix:
-            slab_with_props = AdsorbateSiteFinder(
-                slab_with_props, selective_dynamics=True, height=z_fix
-            ).slab
-
-            surface_species = [
-                site.specie.symbol
-                for site in slab_with_props
-                if site.properties["surface_properties"] == "surface"
-            ]
-
-            # Check that the desired atoms are on the surface
-            if allowed_surface_atoms and not any(
-                allowed_surface_atom in surface_species
-                for allowed_surface_atom in allowed_surface_atoms
-            ):
-                continue
-
-        # Add slab to list
-        slabs_with_props.append(slab_with_props)
-
-    if len(slabs_with_props) == 0:
-        return None
-
-    # Make atoms objects and store slab stats
-    final_slabs = []
-    for slab_with_props in slabs_with_props:
-        final_slab = AseAtomsAdaptor.get_atoms(slab_with_props)
-        slab_stats = {
-            "bulk": atoms,
-            "miller_index": slab_with_props.miller_index,
-            "shift": round(slab_with_props.shift, 3),
-            "scale_factor": slab_with_props.scale_factor,
-        }
-        final_slab.info = atoms_info.copy()
-        final_slab.info["slab_stats"] = slab_stats
-        final_slabs.append(final_slab)
-
-    return final_slabs
+    return _postprocess_slabs(
+        slabs,
+        atoms,
+        min_length_width=min_length_width,
+        z_fix=z_fix,
+        allowed_surface_atoms=allowed_surface_atoms,
+    )
 
 
 def make_max_slabs_from_bulk(
@@ -259,16 +193,23 @@ def make_max_slabs_from_bulk(
 
     """
 
-    slabs = make_slabs_from_bulk(
+    # Only ftol changes between the attempts below, so the bulk structure
+    # is converted a single time and reused
+    struct = AseAtomsAdaptor.get_structure(atoms)
+
+    slabs = _postprocess_slabs(
+        _generate_raw_slabs(
+            struct,
+            max_index,
+            min_slab_size,
+            min_vacuum_size,
+            flip_asymmetric=flip_asymmetric,
+            **slabgen_kwargs,
+        ),
         atoms,
-        max_index=max_index,
-        min_slab_size=min_slab_size,
         min_length_width=min_length_width,
-        min_vacuum_size=min_vacuum_size,
         z_fix=z_fix,
-        flip_asymmetric=flip_asymmetric,
         allowed_surface_atoms=allowed_surface_atoms,
-        **slabgen_kwargs,
     )
 
     # Try to reduce the number of slabs if the user really wants it...
@@ -280,20 +221,32 @@ def make_max_slabs_from_bulk(
                 f"You requested {max_slabs} slabs, but {len(slabs)} were generated. Tuning ftol in generate_all_slabs() to try to reduce the number of slabs, at the expense of sampling fewer surface configurations.",
                 UserWarning,
             )
+            # Postprocessing only ever removes slabs if they are filtered by
+            # their surface atoms. Otherwise, the raw slab count is the final
+            # count, and slabs that would not be kept need not be processed.
+            can_filter = bool(z_fix and allowed_surface_atoms)
+
             for ftol in np.arange(0.1, 0.9, 0.1):
                 slabgen_kwargs["ftol"] = ftol
-                slabs_ftol = make_slabs_from_bulk(
+                raw_slabs = _generate_raw_slabs(
+                    struct,
+                    max_index,
+                    min_slab_size,
+                    min_vacuum_size,
+                    flip_asymmetric=flip_asymmetric,
+                    **slabgen_kwargs,
+                )
+                if not can_filter and len(raw_slabs) >= len(slabs):
+                    continue
+
+                slabs_ftol = _postprocess_slabs(
+                    raw_slabs,
                     atoms,
-                    max_index=max_index,
-                    min_slab_size=min_slab_size,
                     min_length_width=min_length_width,
-                    min_vacuum_size=min_vacuum_size,
                     z_fix=z_fix,
-                    flip_asymmetric=flip_asymmetric,
                     allowed_surface_atoms=allowed_surface_atoms,
-                    **slabgen_kwargs,
                 )
-                if len(slabs_ftol) < len(slabs):
+                if slabs_ftol is not None and len(slabs_ftol) < len(slabs):
                     slabs = slabs_ftol
                 if len(slabs) <= max_slabs:
                     break
@@ -309,6 +262,181 @@ def make_max_slabs_from_bulk(
     return slabs
 
 
+def _generate_raw_slabs(
+    struct: Structure,
+    max_index: int,
+    min_slab_size: float,
+    min_vacuum_size: float,
+    flip_asymmetric: bool = True,
+    **slabgen_kwargs,
+) -> List[Slab]:
+    """
+    Enumerate the slabs of a bulk structure with Pymatgen, without any
+    supercell creation, constraints, or filtering.
+
+    Parameters
+    ----------
+    struct
+        Bulk structure
+    max_index
+        Maximum Miller index for slab generation
+    min_slab_size
+        Minimum slab size (depth) in angstroms
+    min_vacuum_size
+        Minimum vacuum size in angstroms
+    flip_asymmetric
+        If an asymmetric surface should be flipped and added to the list
+    **slabgen_kwargs: keyword arguments to pass to the pymatgen generate_all_slabs() function
+
+    Returns
+    -------
+    List[Slab]
+        All generated slabs
+    """
+
+    slabs = generate_all_slabs(
+        struct,
+        max_index,
+        min_slab_size,
+        min_vacuum_size,
+        center_slab=True,
+        **slabgen_kwargs,
+    )
+
+    # If the two terminations are not equivalent, make new slab
+    # by inverting the original slab and add it to the list
+    if flip_asymmetric:
+        asymmetric_slabs = [slab for slab in slabs if not slab.is_symmetric()]
+        slabs.extend([_flip_slab(slab) for slab in asymmetric_slabs])
+
+    return slabs
+
+
+def _flip_slab(slab: Slab) -> Slab:
+    """
+    Invert a slab so that its bottom termination becomes the top one.
+
+    Parameters
+    ----------
+    slab
+        Slab to flip
+
+    Returns
+    -------
+    Slab
+        Inverted (and centered) slab
+    """
+
+    # Flip the slab and its oriented unit cell
+    new_slab = flip_atoms(slab, return_struct=True)
+    new_oriented_unit_cell = flip_atoms(slab.oriented_unit_cell, return_struct=True)
+
+    # Reconstruct the full slab object, noting the new
+    # shift and oriented unit cell
+    new_slab = Slab(
+        new_slab.lattice,
+        new_slab.species,
+        coords=new_slab.frac_coords,
+        miller_index=slab.miller_index,
+        oriented_unit_cell=new_oriented_unit_cell,
+        shift=-slab.shift,
+        scale_factor=slab.scale_factor,
+        site_properties=new_slab.site_properties,
+    )
+
+    # It looks better to center the inverted slab so we do
+    # that here.
+    return center_slab(new_slab)
+
+
+def _postprocess_slabs(
+    slabs: List[Slab],
+    atoms: Atoms,
+    min_length_width: float = 8.0,
+    z_fix: None | float = 2.0,
+    allowed_surface_atoms: None | List[str] = None,
+) -> None | List[Atoms]:
+    """
+    Turn raw Pymatgen slabs into the final Atoms objects: make supercells,
+    fix subsurface atoms, filter by surface species, and store slab stats.
+
+    Parameters
+    ----------
+    slabs
+        Slabs from _generate_raw_slabs()
+    atoms
+        bulk atoms the slabs were generated from
+    min_length_width
+        Minimum length and width of the slab in angstroms
+    z_fix
+        Distance (in angstroms) from top of slab for which atoms should be fixed
+    allowed_surface_atoms
+        List of chemical symbols that must be present on the surface of the slab otherwise the slab will be discarded, e.g. ["Cu", "Ni"]
+
+    Returns
+    -------
+    Optional[List[.Atoms]]
+        All processed slabs
+    """
+
+    atoms_info = atoms.info.copy()
+
+    # For each slab, make sure the lengths and widths are large enough
+    # and fix atoms z_fix away from the top of the slab.
+    if allowed_surface_atoms:
+        allowed_surface_atoms = frozenset(allowed_surface_atoms)
+    slabs_with_props = []
+    for slab in slabs:
+
+        # Supercell creation (if necessary)
+        a_factor = ceil(min_length_width / slab.lattice.abc[0])
+        b_factor = ceil(min_length_width / slab.lattice.abc[1])
+        slab_with_props = slab.copy()
+        slab_with_props.make_supercell([a_factor, b_factor, 1])
+
+        # Apply constraints by distance from top surface
+        # This does not actually create an adsorbate. It is just a
+        # useful function for finding surface vs. subsurface sites
+        if z_fix:
+            slab_with_props = AdsorbateSiteFinder(
+                slab_with_props, selective_dynamics=True, height=z_fix
+            ).slab
+
+            surface_species = {
+                site.specie.symbol
+                for site in slab_with_props
+                if site.properties["surface_properties"] == "surface"
+            }
+
+            # Check that the desired atoms are on the surface
+            if allowed_surface_atoms and allowed_surface_atoms.isdisjoint(
+                surface_species
+            ):
+                continue
+
+        # Add slab to list
+        slabs_with_props.append(slab_with_props)
+
+    if len(slabs_with_props) == 0:
+        return None
+
+    # Make atoms objects and store slab stats
+    final_slabs = []
+    for slab_with_props in slabs_with_props:
+        final_slab = AseAtomsAdaptor.get_atoms(slab_with_props)
+        slab_stats = {
+            "bulk": atoms,
+            "miller_index": slab_with_props.miller_index,
+            "shift": round(slab_with_props.shift, 3),
+            "scale_factor": slab_with_props.scale_factor,
+        }
+        final_slab.info = atoms_info.copy()
+        final_slab.info["slab_stats"] = slab_stats
+        final_slabs.append(final_slab)
+
+    return final_slabs
+
+
 # TODO: We need a method to orient adsorbate via a kwarg
 def make_adsorbate_structures(
     atoms: Atoms,
@@ -329,8 +457,9 @@ def make_adsorbate_structures(
         The atoms to add adsorbates to.
     adsorbate
         The adsorbate to add. If a string, it will pull from ase.collections.g2
-        Note: It will be placed on the surface in the exact input orientation provided by the user (the adsorption mode is
-        along the c axis and the coordinating atom is the one in the -z direction).
+        Note: It will be placed on the surface in the input orientation provided by the user (the adsorption mode is
+        along the c axis), with the center of mass of its atom(s) in the -z direction placed min_distance above the site.
+        The surface atoms reported in atoms.info["adsorbates"] are those closest to the first atom of the adsorbate.
     min_distance
         The distance between the adsorbate and the surface site.
     modes
@@ -369,9 +498,9 @@ def make_adsorbate_structures(
     find_ads_sites_kwargs["positions"] = [mode.lower() for mode in modes]
 
     # Check the provided surface indices are reasonable
-    atom_indices = [atom.index for atom in atoms]
+    atom_indices = range(len(atoms))
     if allowed_surface_indices and not all(
-        idx in atom_indices for idx in allowed_surface_indices
+        0 <= idx < len(atoms) for idx in allowed_surface_indices
     ):
         raise ValueError(
             "All indices in allowed_surface_indices must be in atoms.",
@@ -398,56 +527,76 @@ def make_adsorbate_structures(
     if adsorbate.has("initial_magmoms") and not atoms.has("initial_magmoms"):
         atoms.set_initial_magnetic_moments([0.0] * len(atoms))
 
-    # Make a Pymatgen structure and molecule
-    struct = AseAtomsAdaptor.get_structure(atoms)
-    mol = AseAtomsAdaptor.get_molecule(adsorbate)
-
     # Get the adsorption sites
+    struct = AseAtomsAdaptor.get_structure(atoms)
     ads_finder = AdsorbateSiteFinder(struct, **ads_site_finder_kwargs)
     ads_sites = ads_finder.find_adsorption_sites(**find_ads_sites_kwargs)
 
+    # Only keep the requested modes that have any sites. Note: ads_sites
+    # also has an "all" entry, which is not a mode
+    requested_modes = frozenset(find_ads_sites_kwargs["positions"])
+    ads_sites = {
+        mode: ads_coords
+        for mode, ads_coords in ads_sites.items()
+        if mode in requested_modes and ads_coords
+    }
+    if not ads_sites:
+        return []
+
+    # Make a Pymatgen molecule
+    mol = AseAtomsAdaptor.get_molecule(adsorbate)
+
     # Find and add the adsorbates
+    if allowed_surface_symbols:
+        allowed_surface_symbols = frozenset(allowed_surface_symbols)
+    if allowed_surface_indices:
+        allowed_surface_indices = frozenset(allowed_surface_indices)
+
+    # Distances to the surface are measured from the first atom of the
+    # adsorbate, which is appended after the slab atoms at every site
+    adsorbate_index = len(atoms)
+
+    # Any adsorbates already on the slab are carried over to each new
+    # structure. Note: atoms.info.copy() is shallow, so this list must not be
+    # modified in-place
+    prior_adsorbates = atoms.info.get("adsorbates", None) or []
+
+    # Place the adsorbate once, at the origin. The slab atoms and the oriented
+    # adsorbate are the same for every site, so each structure below is just a
+    # copy of this template with the adsorbate atoms translated to the site.
+    # This avoids building a new Pymatgen structure for every site.
+    ads_template = AseAtomsAdaptor.get_atoms(ads_finder.add_adsorbate(mol, np.zeros(3)))
+    ads_positions = ads_template.positions[len(atoms) :]
+
     new_atoms = []
     for mode, ads_coords in ads_sites.items():
-
-        # Check if mode is in desired list
-        if mode not in modes:
-            continue
-
         for ads_coord in ads_coords:
 
             # Place adsorbate
-            struct_with_adsorbate = ads_finder.add_adsorbate(mol, ads_coord)
+            atoms_with_adsorbate = ads_template.copy()
+            atoms_with_adsorbate.positions[len(atoms) :] = ads_positions + ads_coord
 
-            # Convert back to Atoms object
-            atoms_with_adsorbate = AseAtomsAdaptor.get_atoms(struct_with_adsorbate)
-
-            # Get distance matrix between adsorbate binding atom and surface
-            adsorbate_index = len(atoms) + np.argmin(atom.z for atom in adsorbate)
-            d = atoms_with_adsorbate.get_all_distances(mic=True)
-            d = d[atom_indices, :]
-            d = d[:, adsorbate_index]
+            # Get distances between adsorbate binding atom and surface. Only
+            # this one row is needed, so don't build the full distance matrix
+            d = atoms_with_adsorbate.get_distances(
+                adsorbate_index, atom_indices, mic=True
+            )
 
             # Find closest surface atoms
-            min_d = min(d)
-            surface_atom_indices = [
-                i for i, val in enumerate(d) if (min_d - 0.01) <= val <= (min_d + 0.01)
-            ]
+            surface_atom_indices = np.flatnonzero(d <= d.min() + 0.01).tolist()
             surface_atom_symbols = atoms_with_adsorbate[
                 surface_atom_indices
             ].get_chemical_symbols()
 
             # Check if surface binding site is not in the specified
             # user list. If so, skip this one
-            if allowed_surface_symbols and not any(
-                surface_atom_symbol in allowed_surface_symbols
-                for surface_atom_symbol in surface_atom_symbols
+            if allowed_surface_symbols and allowed_surface_symbols.isdisjoint(
+                surface_atom_symbols
             ):
                 continue
 
-            if allowed_surface_indices and not any(
-                surface_atom_idx in allowed_surface_indices
-                for surface_atom_idx in surface_atom_indices
+            if allowed_surface_indices and allowed_surface_indices.isdisjoint(
+                surface_atom_indices
             ):
                 continue
 
@@ -459,10 +608,7 @@ def make_adsorbate_structures(
                 "surface_atoms_symbols": surface_atom_symbols,
                 "surface_atoms_indices": surface_atom_indices,
             }
-            if atoms_with_adsorbate.info.get("adsorbates", None) is None:
-                atoms_with_adsorbate.info["adsorbates"] = [ads_stats]
-            else:
-                atoms_with_adsorbate.info["adsorbates"].extend([ads_stats])
+            atoms_with_adsorbate.info["adsorbates"] = prior_adsorbates + [ads_stats]
 
             # Add slab+adsorbate to list
             new_atoms.append(atoms_with_adsorbate)
@@ -1,8 +1,19 @@
 import os
-from typing import Any, Dict
+from collections import OrderedDict
+from copy import deepcopy
+from typing import Any, Dict, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Parsed YAML files, keyed by real path and validated by (mtime, size).
+_YAML_CACHE: OrderedDict[str, Tuple[int, int, Dict[str, Any]]] = OrderedDict()
+_YAML_CACHE_MAXSIZE = 100
+
 
 def load_yaml_calc(yaml_path: str) -> Dict[str, Any]:
     """
@@ -23,12 +34,12 @@ def load_yaml_calc(yaml_path: str) -> Dict[str, Any]:
     if not ext:
         yaml_path += ".yaml"
 
-    if not os.path.exists(yaml_path):
-        raise ValueError(f"Cannot find {yaml_path}.")
-
-    # Load YAML file
-    with open(yaml_path, "r") as stream:
-        config = yaml.safe_load(stream)
+    # Load YAML file. We let os.stat() in _load_yaml() check that the file
+    # exists rather than making a separate os.path.exists() call.
+    try:
+        config = _load_yaml(yaml_path)
+    except FileNotFoundError as err:
+        raise ValueError(f"Cannot find {yaml_path}.") from err
 
     # Inherit arguments from any parent YAML files
     # but do not overwrite those in the child file.
@@ -55,6 +66,52 @@ def load_yaml_calc(yaml_path: str) -> Dict[str, Any]:
     return config
 
 
+def _load_yaml(yaml_path: str) -> Dict[str, Any]:
+    """
+    Loads a YAML file, re-using a previously parsed copy if the file
+    has not been modified (as judged by its mtime and size) since.
+    Parsed copies are only kept in memory.
+
+    Parameters
+    ----------
+    yaml_path
+        Path to the YAML file.
+
+    Returns
+    -------
+    Dict
+        A copy of the parsed YAML file that is safe to modify.
+    """
+
+    st = os.stat(yaml_path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    key = os.path.realpath(yaml_path)
+
+    cached = _YAML_CACHE.get(key)
+    if cached and cached[:2] == stamp:
+        _YAML_CACHE.move_to_end(key)
+        return deepcopy(cached[2])
+
+    with open(yaml_path, "r") as stream:
+        config = yaml.load(stream, Loader=_Loader)
+
+    _YAML_CACHE[key] = (*stamp, config)
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAXSIZE:
+        _YAML_CACHE.popitem(last=False)
+
+    return deepcopy(config)
+
+
+def clear_yaml_cache() -> None:
+    """
+    Clears the in-memory cache of parsed YAML files used by load_yaml_calc().
+    This is generally only needed for testing, since modified YAML files are
+    detected and re-parsed automatically.
+    """
+    _YAML_CACHE.clear()
+
+
 def load_yaml_settings(yaml_file: str) -> Dict[str, Any]:
     """
     Loads a standard YAML settings file. Any entry marked with
@@ -69,7 +126,8 @@ def load_yaml_settings(yaml_file: str) -> Dict[str, Any]:
         The settings specified in the YAML file.
     """
 
-    settings = yaml.safe_load(open(yaml_file))
+    with open(yaml_file, "r") as stream:
+        settings = yaml.load(stream, Loader=_Loader)
 
     # If $ is the first character, get from the environment variable
     for k, v in settings.items():
@@ -0,0 +1,9 @@
+import pytest
+from ase.build import bulk
+
+
+@pytest.fixture(scope="session")
+def cu_bulk():
+    # Bulk Cu is the starting point for most of the SmartVasp tests, so we only
+    # build it once. Tests should work on a copy (e.g. cu_bulk.copy()) of it.
+    return bulk("Cu")
@@ -21,19 +21,32 @@ ATOMS_NOMAG = read(os.path.join(FILE_DIR, "OUTCAR_nomag.gz"))
 ATOMS_NOSPIN = read(os.path.join(FILE_DIR, "OUTCAR_nospin.gz"))
 
 
-def test_vanilla_smartvasp():
-    atoms = bulk("Cu")
+def _expected_mags(n, fill, last):
+    # All magmoms are fill except for the last one
+    mags = np.full(n, fill)
+    mags[-1] = last
+    return mags
+
+
+def test_vanilla_smartvasp(cu_bulk):
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, incar_copilot=False)
     assert atoms.calc.asdict() == Vasp().asdict()
 
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, custodian=False, incar_copilot=False)
     assert atoms.calc.asdict() == Vasp().asdict()
 
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, encut=None, incar_copilot=False)
     assert atoms.calc.asdict() == Vasp().asdict()
 
+    atoms = cu_bulk.copy()
+    new_atoms = SmartVasp(atoms, preset="BulkRelaxSet")
+    assert atoms.calc is None
+    assert not atoms.has("initial_magmoms")
+    assert new_atoms.calc is not None
+
 
 def test_presets():
     atoms = bulk("Co") * (2, 2, 1)
@@ -62,8 +75,8 @@ def test_presets():
     assert atoms.calc.int_params["isif"] == 3
 
 
-def test_lmaxmix():
-    atoms = bulk("Cu")
+def test_lmaxmix(cu_bulk):
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms)
     assert atoms.calc.int_params["lmaxmix"] == 4
 
@@ -71,14 +84,14 @@ def test_lmaxmix():
     atoms = SmartVasp(atoms)
     assert atoms.calc.int_params["lmaxmix"] == 6
 
-    atoms = bulk("Cu") * (2, 2, 2)
+    atoms = cu_bulk * (2, 2, 2)
     atoms[-1].symbol = "Ce"
     atoms = SmartVasp(atoms)
     assert atoms.calc.int_params["lmaxmix"] == 6
 
 
-def test_autodipole():
-    atoms = bulk("Cu")
+def test_autodipole(cu_bulk):
+    atoms = cu_bulk.copy()
     com = atoms.get_center_of_mass(scaled=True)
     atoms = SmartVasp(atoms, auto_dipole=True)
     assert atoms.calc.bool_params["ldipol"] is True
@@ -106,8 +119,8 @@ def test_autodipole():
     assert atoms.calc.list_float_params["dipol"] is None
 
 
-def test_kspacing():
-    atoms = bulk("Cu")
+def test_kspacing(cu_bulk):
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, kspacing=0.1, ismear=-5)
     assert atoms.calc.int_params["ismear"] == -5
 
@@ -115,7 +128,7 @@ def test_kspacing():
     assert atoms.calc.int_params["ismear"] == 0
 
 
-def test_magmoms():
+def test_magmoms(cu_bulk):
     atoms = bulk("Mg")
     atoms = SmartVasp(atoms)
     assert atoms.has("initial_magmoms") is False
@@ -123,43 +136,45 @@ def test_magmoms():
     atoms = bulk("Mg")
     atoms.set_initial_magnetic_moments([3.14] * len(atoms))
     atoms = SmartVasp(atoms)
-    assert atoms.get_initial_magnetic_moments().tolist() == [3.14] * len(atoms)
+    assert np.allclose(atoms.get_initial_magnetic_moments(), 3.14, atol=1e-12)
 
-    atoms = bulk("Cu") * (2, 2, 1)
+    atoms = cu_bulk * (2, 2, 1)
     atoms[-1].symbol = "Fe"
     atoms = SmartVasp(atoms, preset="BulkRelaxSet")
-    assert atoms.get_initial_magnetic_moments().tolist() == [2.0] * (len(atoms) - 1) + [
-        5.0
-    ]
+    assert np.array_equal(
+        atoms.get_initial_magnetic_moments(), _expected_mags(len(atoms), 2.0, 5.0)
+    )
 
     atoms = bulk("Zn") * (2, 2, 1)
     atoms[-1].symbol = "Fe"
     atoms = SmartVasp(atoms, preset="BulkRelaxSet", mag_default=2.5)
-    assert atoms.get_initial_magnetic_moments().tolist() == [2.5] * (len(atoms) - 1) + [
-        5.0
-    ]
+    assert np.array_equal(
+        atoms.get_initial_magnetic_moments(), _expected_mags(len(atoms), 2.5, 5.0)
+    )
 
     atoms = bulk("Eu") * (2, 2, 1)
     atoms[-1].symbol = "Fe"
     atoms = SmartVasp(atoms, preset="SlabRelaxSet")
-    assert atoms.get_initial_magnetic_moments().tolist() == [7.0] * (len(atoms) - 1) + [
-        5.0
-    ]
+    assert np.array_equal(
+        atoms.get_initial_magnetic_moments(), _expected_mags(len(atoms), 7.0, 5.0)
+    )
 
-    atoms = bulk("Cu") * (2, 2, 1)
+    atoms = cu_bulk * (2, 2, 1)
     atoms[-1].symbol = "Fe"
     atoms = SmartVasp(atoms, preset="MPScanRelaxSet")
-    assert atoms.get_initial_magnetic_moments().tolist() == [1.0] * (len(atoms) - 1) + [
-        5.0
-    ]
+    assert np.array_equal(
+        atoms.get_initial_magnetic_moments(), _expected_mags(len(atoms), 1.0, 5.0)
+    )
 
-    atoms = bulk("Cu") * (2, 2, 1)
+    atoms = cu_bulk * (2, 2, 1)
     atoms[-1].symbol = "Fe"
     atoms.set_initial_magnetic_moments([3.14] * (len(atoms) - 1) + [1.0])
     atoms = SmartVasp(atoms, preset="BulkRelaxSet")
-    assert atoms.get_initial_magnetic_moments().tolist() == [3.14] * (
-        len(atoms) - 1
-    ) + [1.0]
+    assert np.allclose(
+        atoms.get_initial_magnetic_moments(),
+        _expected_mags(len(atoms), 3.14, 1.0),
+        atol=1e-12,
+    )
 
     atoms = bulk("Co") * (2, 2, 1)
     atoms[-1].symbol = "Fe"
@@ -221,7 +236,7 @@ def test_magmoms():
     atoms = SmartVasp(atoms, preset="BulkRelaxSet")
     assert np.all(atoms.get_initial_magnetic_moments() == 1)
 
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, preset="BulkRelaxSet", copy_magmoms=False)
     assert np.all(atoms.get_initial_magnetic_moments() == 2.0)
     atoms.calc.results = {"magmoms": [3.0] * len(atoms)}
@@ -254,7 +269,7 @@ def test_magmoms():
     atoms = prep_next_run(atoms)
     atoms = SmartVasp(atoms, preset="BulkRelaxSet")
     assert atoms.has("initial_magmoms") is True
-    assert atoms.get_initial_magnetic_moments().tolist() == mags.tolist()
+    assert np.allclose(atoms.get_initial_magnetic_moments(), mags, atol=1e-12)
 
     atoms = deepcopy(ATOMS_NOMAG)
     atoms = prep_next_run(atoms)
@@ -307,8 +322,8 @@ def test_magmoms():
     np.all(atoms.get_initial_magnetic_moments() == 3.14)
 
 
-def test_unused_flags():
-    atoms = bulk("Cu")
+def test_unused_flags(cu_bulk):
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, preset="BulkRelaxSet", potim=1.5, nsw=0)
     assert atoms.calc.int_params["nsw"] == 0
     assert atoms.calc.exp_params["ediffg"] is None
@@ -320,8 +335,8 @@ def test_unused_flags():
     assert atoms.calc.bool_params["ldau"] is None
 
 
-def test_lasph():
-    atoms = bulk("Cu")
+def test_lasph(cu_bulk):
+    atoms = cu_bulk.copy()
 
     atoms = SmartVasp(atoms, xc="rpbe")
     assert atoms.calc.bool_params["lasph"] is None
@@ -342,8 +357,8 @@ def test_lasph():
     assert atoms.calc.bool_params["lasph"] is True
 
 
-def test_lmaxtau():
-    atoms = bulk("Cu")
+def test_lmaxtau(cu_bulk):
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, lasph=True)
     assert atoms.calc.int_params["lmaxtau"] is None
 
@@ -351,14 +366,14 @@ def test_lmaxtau():
     atoms = SmartVasp(atoms, lasph=True)
     assert atoms.calc.int_params["lmaxtau"] == 8
 
-    atoms = bulk("Cu") * (2, 2, 2)
+    atoms = cu_bulk * (2, 2, 2)
     atoms[-1].symbol = "Ce"
     atoms = SmartVasp(atoms, lasph=True)
     assert atoms.calc.int_params["lmaxtau"] == 8
 
 
-def test_algo():
-    atoms = bulk("Cu")
+def test_algo(cu_bulk):
+    atoms = cu_bulk.copy()
 
     atoms = SmartVasp(atoms, xc="rpbe")
     assert atoms.calc.string_params["algo"] is None
@@ -378,8 +393,8 @@ def test_algo():
     assert atoms.calc.string_params["algo"] == "all"
 
 
-def test_kpar():
-    atoms = bulk("Cu")
+def test_kpar(cu_bulk):
+    atoms = cu_bulk.copy()
 
     atoms = SmartVasp(atoms, kpts=[2, 2, 1], kpar=4)
     assert atoms.calc.int_params["kpar"] == 4
@@ -388,8 +403,8 @@ def test_kpar():
     assert atoms.calc.int_params["kpar"] == 1
 
 
-def test_isym():
-    atoms = bulk("Cu")
+def test_isym(cu_bulk):
+    atoms = cu_bulk.copy()
 
     atoms = SmartVasp(atoms, isym=2)
     assert atoms.calc.int_params["isym"] == 2
@@ -407,8 +422,8 @@ def test_isym():
     assert atoms.calc.int_params["isym"] == 0
 
 
-def test_ncore():
-    atoms = bulk("Cu")
+def test_ncore(cu_bulk):
+    atoms = cu_bulk.copy()
 
     atoms = SmartVasp(atoms, ncore=16)
     assert atoms.calc.int_params["ncore"] == 1
@@ -429,8 +444,8 @@ def test_ncore():
     assert atoms.calc.int_params["npar"] is None
 
 
-def test_ismear():
-    atoms = bulk("Cu")
+def test_ismear(cu_bulk):
+    atoms = cu_bulk.copy()
 
     atoms = SmartVasp(atoms, nsw=10)
     assert atoms.calc.int_params["ismear"] is None
@@ -481,8 +496,8 @@ def test_ismear():
     assert atoms.calc.int_params["ismear"] == -5
 
 
-def test_laechg():
-    atoms = bulk("Cu")
+def test_laechg(cu_bulk):
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, nsw=10, laechg=True)
     assert atoms.calc.bool_params["laechg"] is None
 
@@ -496,8 +511,8 @@ def test_laechg():
     assert atoms.calc.bool_params["laechg"] is False
 
 
-def test_ldauprint():
-    atoms = bulk("Cu")
+def test_ldauprint(cu_bulk):
+    atoms = cu_bulk.copy()
 
     atoms = SmartVasp(atoms, ldau=True)
     assert atoms.calc.int_params["ldauprint"] == 1
@@ -512,8 +527,8 @@ def test_ldauprint():
     assert atoms.calc.int_params["ldauprint"] == 1
 
 
-def test_lreal():
-    atoms = bulk("Cu")
+def test_lreal(cu_bulk):
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, lreal=True, nsw=0)
     assert atoms.calc.special_params["lreal"] is False
 
@@ -524,36 +539,36 @@ def test_lreal():
     assert atoms.calc.special_params["lreal"] is None
 
 
-def test_lorbit():
-    atoms = bulk("Cu")
+def test_lorbit(cu_bulk):
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, ispin=2)
     assert atoms.calc.int_params["lorbit"] == 11
 
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, ispin=1)
     assert atoms.calc.int_params["lorbit"] is None
 
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     atoms.set_initial_magnetic_moments([1.0] * len(atoms))
     atoms = SmartVasp(atoms)
     assert atoms.calc.int_params["lorbit"] == 11
 
 
-def test_setups():
-    atoms = bulk("Cu")
+def test_setups(cu_bulk):
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, preset="BulkRelaxSet")
     assert atoms.calc.parameters["setups"]["Cu"] == ""
 
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, preset="SlabRelaxSet")
     assert atoms.calc.parameters["setups"]["Ba"] == "_sv"
     assert atoms.calc.parameters["setups"]["Cu"] == ""
 
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, preset="MPScanRelaxSet")
     assert atoms.calc.parameters["setups"]["Cu"] == "_pv"
 
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(
         atoms,
         setups=os.path.join(FILE_DIR, "test_setups.yaml"),
@@ -561,7 +576,7 @@ def test_setups():
     )
     assert atoms.calc.parameters["setups"]["Cu"] == "_pv"
 
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(
         atoms,
         setups="pbe54_MP.yaml",
@@ -569,7 +584,7 @@ def test_setups():
     )
     assert atoms.calc.parameters["setups"]["Cu"] == "_pv"
 
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, setups="minimal", preset="MPScanRelaxSet")
     assert (
         isinstance(atoms.calc.parameters["setups"], str)
@@ -577,22 +592,22 @@ def test_setups():
     )
 
 
-def test_kpoint_schemes():
-    atoms = bulk("Cu")
+def test_kpoint_schemes(cu_bulk):
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, kpts=[1, 1, 1], preset="BulkRelaxSet")
     assert atoms.calc.kpts == [1, 1, 1]
 
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, auto_kpts={"grid_density": 1000}, gamma=False)
     assert atoms.calc.kpts == [10, 10, 10]
     assert atoms.calc.input_params["gamma"] is False
 
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, auto_kpts={"grid_density": 1000})
     assert atoms.calc.kpts == [10, 10, 10]
     assert atoms.calc.input_params["gamma"] is True
 
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(
         atoms,
         preset="BulkRelaxSet",
@@ -602,48 +617,48 @@ def test_kpoint_schemes():
     assert atoms.calc.kpts == [10, 10, 10]
     assert atoms.calc.input_params["gamma"] is False
 
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, auto_kpts={"grid_density": 1000}, gamma=True)
     assert atoms.calc.kpts == [10, 10, 10]
     assert atoms.calc.input_params["gamma"] is True
 
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, auto_kpts={"reciprocal_density": 100})
     assert atoms.calc.kpts == [12, 12, 12]
 
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, auto_kpts={"max_mixed_density": [100, 1000]})
     assert atoms.calc.kpts == [12, 12, 12]
 
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, auto_kpts={"max_mixed_density": [10, 1000]})
     assert atoms.calc.kpts == [10, 10, 10]
 
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, auto_kpts={"length_density": [50, 50, 1]})
     assert atoms.calc.kpts == [20, 20, 1]
 
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     atoms = SmartVasp(atoms, auto_kpts={"line_density": 100})
     assert atoms.calc.kpts[-1, :] == pytest.approx(
         np.array([1.30537091e00, 1.11022302e-16, 1.30537091e00])
     )
 
 
-def test_constraints():
-    atoms = bulk("Cu")
+def test_constraints(cu_bulk):
+    atoms = cu_bulk.copy()
     atoms.set_constraint(FixAtoms(indices=[0]))
     atoms = SmartVasp(atoms)
     assert isinstance(atoms.constraints[0], FixAtoms)
 
-    atoms = bulk("Cu") * (2, 1, 1)
+    atoms = cu_bulk * (2, 1, 1)
     atoms.set_constraint(FixBondLength(0, 1))
     with pytest.raises(ValueError):
         atoms = SmartVasp(atoms)
 
 
-def test_bad():
-    atoms = bulk("Cu")
+def test_bad(cu_bulk):
+    atoms = cu_bulk.copy()
     with pytest.raises(ValueError):
         atoms = SmartVasp(atoms, auto_kpts={"max_mixed_density": [100]})
 
@@ -660,8 +675,8 @@ def test_bad():
         atoms = SmartVasp(atoms, preset="BadRelaxSet")
 
 
-def test_bad_custodian(monkeypatch):
+def test_bad_custodian(monkeypatch, cu_bulk):
     monkeypatch.setenv("VASP_CUSTODIAN_SETTINGS", ".")
-    atoms = bulk("Cu")
+    atoms = cu_bulk.copy()
     with pytest.raises(FileNotFoundError):
         atoms = SmartVasp(atoms)
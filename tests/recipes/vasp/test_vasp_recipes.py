@@ -207,3 +207,12 @@ def test_slab_flows():
     assert output2["parameters"]["nelmin"] == 6
     assert output2["parameters"]["encut"] == 450
     assert output2["name"] == "VASP-SlabStatic"
+
+
+def test_slab_flows_default_makers():
+    # Each flow maker should get its own default sub-makers
+    assert BulkToSlabMaker().slab_relax_maker is not BulkToSlabMaker().slab_relax_maker
+    assert (
+        SlabToAdsSlabMaker().slab_static_maker
+        is not SlabToAdsSlabMaker().slab_static_maker
+    )
@@ -34,3 +34,14 @@ def test_atoms_to_metadata():
     # test document can be jsanitized and decoded
     d = jsanitize(results, strict=True, enum_values=True)
     MontyDecoder().process_decoded(d)
+
+
+def test_atoms_to_metadata_cached():
+    atoms = bulk("Cu")
+    results = atoms_to_metadata(atoms)
+    results["nsites"] = 100
+    assert atoms_to_metadata(atoms)["nsites"] == len(atoms)
+
+    atoms.set_initial_magnetic_moments([1.0] * len(atoms))
+    atoms *= (2, 1, 1)
+    assert atoms_to_metadata(atoms)["nsites"] == len(atoms)
@@ -0,0 +1,14 @@
+from quacc.util.basics import merge_dicts
+
+
+def test_merge_dicts():
+    d1 = {"a": 1, "B": 2, "c": 3, "d": 4}
+    d2 = {"A": 10, "c": None, "d": False}
+
+    assert merge_dicts(d1, d2) == {"a": 10, "b": 2, "c": None, "d": False}
+    assert merge_dicts(d1, d2, remove_none=True) == {"a": 10, "b": 2, "d": False}
+    assert merge_dicts(d1, d2, remove_false=True) == {"a": 10, "b": 2, "c": None}
+    assert merge_dicts(d1, d2, remove_none=True, remove_false=True) == {
+        "a": 10,
+        "b": 2,
+    }
@@ -39,13 +39,14 @@ def mock_chargemol_analysis(*args, **kwargs):
 
 @pytest.fixture(autouse=True)
 def patch_pop_analyses(monkeypatch):
-    # Monkeypatch the Bader and Chargemol analyses so they don't run via pytest
+    # Monkeypatch the Bader and Chargemol analyses so they don't run via pytest.
+    # These are imported when the functions are called, so we patch them at the source.
     monkeypatch.setattr(
-        "quacc.util.pop_analysis.bader_analysis_from_path",
+        "pymatgen.command_line.bader_caller.bader_analysis_from_path",
         mock_bader_analysis,
     )
     monkeypatch.setattr(
-        "quacc.util.pop_analysis.ChargemolAnalysis",
+        "pymatgen.command_line.chargemol_caller.ChargemolAnalysis",
         mock_chargemol_analysis,
     )
 
@@ -75,8 +76,12 @@ def test_run_bader():
 
 def test_bader_erorr():
     os.remove("CHGCAR")
-    with pytest.raises(FileNotFoundError):
+    with pytest.raises(FileNotFoundError, match="CHGCAR"):
+        run_bader()
+    os.rename("POTCAR", "POTCAR.bak")
+    with pytest.raises(FileNotFoundError, match="CHGCAR, POTCAR"):
         run_bader()
+    os.rename("POTCAR.bak", "POTCAR")
     with open("CHGCAR", "w") as w:
         w.write("test")
 
@@ -6,6 +6,7 @@ import numpy as np
 import pytest
 from ase.build import bulk, fcc100, molecule
 from ase.io import read
+from pymatgen.io.ase import AseAtomsAdaptor
 
 from quacc.util.slabs import (
     flip_atoms,
@@ -41,6 +42,14 @@ def test_flip_atoms():
     assert np.all(new_atoms.get_initial_magnetic_moments()[Te_idx] == 1.0)
     assert new_atoms.info.get("test", None) == "hi"
 
+    struct = AseAtomsAdaptor.get_structure(atoms)
+    new_struct = flip_atoms(struct, return_struct=True)
+    assert new_struct.lattice == struct.lattice
+    assert new_struct.site_properties["magmom"] == struct.site_properties["magmom"]
+    assert np.allclose(
+        new_struct.cart_coords, AseAtomsAdaptor.get_structure(new_atoms).cart_coords
+    )
+
 
 def test_make_slabs_from_bulk():
     atoms = read(os.path.join(FILE_DIR, "ZnTe.cif.gz"))
@@ -68,6 +77,13 @@ def test_make_slabs_from_bulk():
     slabs = make_slabs_from_bulk(atoms, flip_asymmetric=False)
     assert len(slabs) == 4
 
+    # Sites are wrapped into the cell even when no supercell is needed
+    atoms = read(os.path.join(FILE_DIR, "ZnTe.cif.gz"))
+    slabs = make_slabs_from_bulk(atoms, min_length_width=2.0)
+    for slab in slabs:
+        scaled_positions = slab.get_scaled_positions(wrap=False)
+        assert np.all((scaled_positions >= 0) & (scaled_positions < 1))
+
     atoms = bulk("Cu")
     slabs = make_slabs_from_bulk(atoms, allowed_surface_atoms=["Co"])
     assert slabs is None
@@ -162,6 +178,8 @@ def test_make_adsorbate_structures():
     assert new_atoms[0].get_initial_magnetic_moments().tolist() == mags + [0, 0, 0]
     new_atoms = make_adsorbate_structures(atoms, "H2O", modes=["ontop"])
     assert len(new_atoms) == 1
+    new_atoms = make_adsorbate_structures(atoms, "H2O", modes=["Ontop"])
+    assert len(new_atoms) == 1
 
     new_atoms = make_adsorbate_structures(
         atoms, "H2O", allowed_surface_symbols=["Cu", "Fe"]
@@ -192,6 +210,11 @@ def test_make_adsorbate_structures():
     assert new_atoms[0].info.get("adsorbates", None) is not None
     assert new_atoms[0].info["adsorbates"][0]["adsorbate"] == molecule("H2O")
 
+    new_atoms2 = make_adsorbate_structures(new_atoms[0], "CO", modes=["ontop"])
+    assert [len(a.info["adsorbates"]) for a in new_atoms2] == [2] * len(new_atoms2)
+    assert new_atoms2[0].info["adsorbates"][1]["adsorbate"] == molecule("CO")
+    assert len(new_atoms[0].info["adsorbates"]) == 1
+
 
 def test_errors():
     atoms = fcc100("Cu", size=(2, 2, 2))
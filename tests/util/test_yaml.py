@@ -0,0 +1,34 @@
+import os
+
+from quacc.calculators.vasp import DEFAULT_CALCS_DIR
+from quacc.util.yaml import clear_yaml_cache, load_yaml_calc
+
+
+def test_load_yaml_calc():
+    config = load_yaml_calc(os.path.join(DEFAULT_CALCS_DIR, "BulkRelaxSet"))
+    assert config["inputs"]["isif"] == 3
+    assert "setups" in config["inputs"]
+
+    # Modifying the returned dict must not affect future loads
+    config["inputs"]["isif"] = 2
+    config = load_yaml_calc(os.path.join(DEFAULT_CALCS_DIR, "BulkRelaxSet"))
+    assert config["inputs"]["isif"] == 3
+
+
+def test_load_yaml_calc_modified(tmp_path):
+    yaml_path = tmp_path / "test.yaml"
+    yaml_path.write_text("inputs:\n  encut: 400\n")
+    assert load_yaml_calc(str(yaml_path))["inputs"]["encut"] == 400
+
+    yaml_path.write_text("inputs:\n  encut: 5200\n")
+    assert load_yaml_calc(str(yaml_path))["inputs"]["encut"] == 5200
+
+
+def test_load_yaml_calc_no_side_files(tmp_path):
+    yaml_path = tmp_path / "test.yaml"
+    yaml_path.write_text("inputs:\n  encut: 520\n")
+    assert load_yaml_calc(str(yaml_path))["inputs"]["encut"] == 520
+    assert os.listdir(tmp_path) == ["test.yaml"]
+
+    clear_yaml_cache()
+    assert load_yaml_calc(str(yaml_path))["inputs"]["encut"] == 520